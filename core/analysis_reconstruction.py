@@ -102,7 +102,8 @@ def reconstruct_theoretical_curve(params: dict, num_points: int | None = None):
 
     Estratégia:
     - Se params tiver 'curve_points', usa diretamente os pontos salvos
-      (freqs_Hz, gain_norm), garantindo curva idêntica ao simulador.
+      (no .npz em 'npz_path', resolvido por DataManager.load_theoretical_data,
+      ou, em arquivos antigos, como listas freqs_Hz/gain_norm no JSON), garantindo curva idêntica ao simulador.
     - Caso contrário (arquivos antigos), re-simula via core.rlc_theory.
 
     Retorna:
@@ -114,8 +115,17 @@ def reconstruct_theoretical_curve(params: dict, num_points: int | None = None):
     curve_points = params.get("curve_points")
     if curve_points is not None:
         try:
-            freqs = np.asarray(curve_points.get("freqs_Hz", []), dtype=float)
-            gain_norm = np.asarray(curve_points.get("gain_norm", []), dtype=float)
+            npz_path = curve_points.get("npz_path")
+            if npz_path:
+                # Formato novo: .npz ao lado do JSON, com freqs em float32 e o
+                # ganho em ponto fixo uint16 + fator de escala
+                with np.load(npz_path) as data:
+                    freqs = np.asarray(data["freqs_Hz"], dtype=float)
+                    gain_norm = data["gain_u16"] * float(data["gain_scale"])
+            else:
+                # Formato antigo: listas de floats dentro do JSON
+                freqs = np.asarray(curve_points.get("freqs_Hz", []), dtype=float)
+                gain_norm = np.asarray(curve_points.get("gain_norm", []), dtype=float)
 
             if freqs.size > 0 and gain_norm.size == freqs.size:
                 df = pd.DataFrame(
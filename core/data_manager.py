@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 import os
 import json
 from datetime import datetime
@@ -16,14 +17,25 @@ class DataManager:
         
         self.save_dir = str(self.save_dir)
 
-    def save_theoretical_params(self, name, parameters):
-        """Salva parâmetros teóricos e tolerâncias para comparação futura."""
+    def save_theoretical_params(self, name, parameters, curve_points=None):
+        """Salva parâmetros teóricos e tolerâncias para comparação futura.
+
+        curve_points (opcional): dict de ndarrays da curva nominal,
+        gravado num .npz ao lado do JSON em vez de listas de floats.
+        """
         exp_path = os.path.join(self.save_dir, name)
         if not os.path.exists(exp_path):
             os.makedirs(exp_path)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
+        # Pontos da curva vão binários no .npz; o JSON guarda só o nome do
+        # arquivo (relativo à pasta do experimento, que pode ser movida)
+        if curve_points:
+            npz_file = f"{name}_theoretical_{timestamp}.npz"
+            np.savez_compressed(os.path.join(exp_path, npz_file), **curve_points)
+            parameters['curve_points'] = {'npz_file': npz_file}
+
         # Salva apenas a metadata teórica
         parameters['timestamp'] = timestamp
         json_path = os.path.join(exp_path, f"{name}_theoretical_{timestamp}.json")
@@ -50,6 +62,11 @@ class DataManager:
         json_path = os.path.join(exp_path, json_files[0])
         with open(json_path, 'r') as f:
             metadata = json.load(f)
+
+        # Resolve o .npz da curva em relação à pasta do JSON
+        curve_points = metadata.get('curve_points')
+        if isinstance(curve_points, dict) and curve_points.get('npz_file'):
+            curve_points['npz_path'] = os.path.join(exp_path, curve_points['npz_file'])
             
         # Para fins de plotagem, o "dado" é apenas a metadata.
         # Retornamos None para o DF, pois a curva é reconstruída na aba de Análise
@@ -45,6 +45,8 @@ Este módulo é exatamente o que é usado para gerar as curvas no simulador teó
 e para calcular a resposta nominal e com tolerâncias.
 """
 
+from functools import lru_cache
+
 import numpy as np
 
 
@@ -273,17 +275,43 @@ def calculate_min_max_metrics(R_nom, L_nom, C_nom, tol_R, tol_L, tol_C):
         "f2": (np.min(metrics["f2"]), np.max(metrics["f2"])),
     }
 
-def _transfer_gain(freqs, R, L, C):
+def _transfer_gain_into(w, R, L, C, out):
+    """
+    G = Vout/Vin do circuito RLC série, assumindo medição no resistor:
+    escreve G = R / |Z_eq| em `out` (in-place).
+
+    `w` é o vetor de frequências angulares (rad/s), de forma (N,).
+    R, L e C podem ser escalares (out com forma (N,)) ou colunas de
+    forma (K, 1), avaliando K combinações de uma vez (out com forma (K, N)).
+    As etapas reaproveitam `out`; o único temporário é `w * L` (do mesmo
+    tamanho de `out`), em vez de um vetor novo por operação.
+    """
+    np.multiply(w, C, out=out)
+    out += 1e-30                      # evita divisão por zero em f -> 0
+    np.reciprocal(out, out=out)       # X_C
+    np.subtract(out, w * L, out=out)  # X_C - X_L (o sinal some no quadrado)
+    np.square(out, out=out)
+    out += R**2
+    np.sqrt(out, out=out)             # |Z_eq|
+    np.divide(R, out, out=out)
+    return out
+
+
+@lru_cache(maxsize=16)
+def _log_freq_grid(freq_min, freq_max, num_points):
     """
-    G(f) = Vout/Vin do circuito RLC série,
-    assumindo medição no resistor.
+    Malha logarítmica de frequências (Hz) e as respectivas frequências
+    angulares (rad/s), memoizadas por (freq_min, freq_max, num_points).
+
+    Com faixa fixa, simulações seguidas reaproveitam os mesmos vetores em
+    vez de refazer logspace a cada chamada; por serem compartilhados, os
+    vetores ficam somente-leitura (para fora do módulo só sai cópia de freqs).
     """
+    freqs = np.logspace(np.log10(freq_min), np.log10(freq_max), num_points)
     w = 2.0 * np.pi * freqs
-    # evita divisão por zero em f -> 0
-    Xc = 1.0 / (w * C + 1e-30)
-    Xl = w * L
-    Z = np.sqrt(R**2 + (Xl - Xc)**2)
-    return R / Z
+    freqs.setflags(write=False)
+    w.setflags(write=False)
+    return freqs, w
 
 
 def _compute_metrics(R, L, C):
@@ -433,64 +461,56 @@ def simulate_response_with_tolerances(
         if freq_max_eff <= freq_min_eff:
             freq_max_eff = freq_min_eff * 10.0
 
-    freqs = np.logspace(
-        np.log10(freq_min_eff),
-        np.log10(freq_max_eff),
-        int(num_points),
-    )
-
-    # 3) Curva nominal
-    gain_nom = _transfer_gain(freqs, R_nom, L_nom, C_nom)
-    nom_curve_Vout = gain_nom * V_in_plot
-
-    # Inicializa min/max com a curva nominal
-    min_curve_Vout = nom_curve_Vout.copy()
-    max_curve_Vout = nom_curve_Vout.copy()
-
-    # 4) Varredura de tolerâncias (R, L, C nos extremos)
-    metrics_lists = {k: [] for k in metrics_nom.keys()}
-
-    factors_r = [1.0 - tol_R, 1.0 + tol_R]
-    factors_l = [1.0 - tol_L, 1.0 + tol_L]
-    factors_c = [1.0 - tol_C, 1.0 + tol_C]
-
-    for fr in factors_r:
-        for fl in factors_l:
-            for fc in factors_c:
-                R = R_nom * fr
-                L = L_nom * fl
-                C = C_nom * fc
+    freqs, w = _log_freq_grid(float(freq_min_eff), float(freq_max_eff), int(num_points))
 
-                # Proteção básica contra valores degenerados
-                if R <= 0 or L <= 0 or C <= 0:
-                    continue
-
-                # Métricas para essa combinação
-                m = _compute_metrics(R, L, C)
-                for k in metrics_lists.keys():
-                    metrics_lists[k].append(m[k])
-
-                # Curva para essa combinação extrema
-                gain_ext = _transfer_gain(freqs, R, L, C)
-                vout_ext = gain_ext * V_in_plot
-
-                min_curve_Vout = np.minimum(min_curve_Vout, vout_ext)
-                max_curve_Vout = np.maximum(max_curve_Vout, vout_ext)
-
-    # 5) Ranges min/max das métricas
-    ranges = {}
-    for k, arr in metrics_lists.items():
-        if len(arr) == 0:
-            # Se nada foi acumulado (caso extremo), usa o nominal
-            ranges[k] = (metrics_nom[k], metrics_nom[k])
-        else:
-            ranges[k] = (float(np.min(arr)), float(np.max(arr)))
+    # 3) Combinações: linha 0 = nominal, demais = extremos de tolerância
+    #    (R, L, C em { nominal * (1 ± tol) })
+    signs = np.array([-1.0, 1.0])
+    fr, fl, fc = np.meshgrid(
+        1.0 + signs * tol_R,
+        1.0 + signs * tol_L,
+        1.0 + signs * tol_C,
+        indexing="ij",
+    )
+    R_ext = R_nom * fr.ravel()
+    L_ext = L_nom * fl.ravel()
+    C_ext = C_nom * fc.ravel()
+
+    # Proteção básica contra valores degenerados
+    valid = (R_ext > 0) & (L_ext > 0) & (C_ext > 0)
+    R_ext, L_ext, C_ext = R_ext[valid], L_ext[valid], C_ext[valid]
+
+    R_all = np.concatenate(([R_nom], R_ext))[:, None]
+    L_all = np.concatenate(([L_nom], L_ext))[:, None]
+    C_all = np.concatenate(([C_nom], C_ext))[:, None]
+
+    # 4) Todas as curvas de uma vez, num único buffer (K, N)
+    curves = np.empty((R_all.shape[0], freqs.size))
+    _transfer_gain_into(w, R_all, L_all, C_all, curves)
+    curves *= V_in_plot
+
+    nom_curve_Vout = curves[0].copy()
+    min_curve_Vout = curves.min(axis=0)
+    max_curve_Vout = curves.max(axis=0)
+
+    # 5) Ranges min/max das métricas (métricas calculadas em vetor para os cantos)
+    if R_ext.size == 0:
+        # Se nenhum canto é válido (caso extremo), usa o nominal
+        ranges = {k: (metrics_nom[k], metrics_nom[k]) for k in metrics_nom}
+    else:
+        metrics_ext = _compute_metrics(R_ext, L_ext, C_ext)
+        ranges = {
+            k: (float(np.min(arr)), float(np.max(arr)))
+            for k, arr in metrics_ext.items()
+        }
 
     # 6) Máximo global da curva (para auto-escala no eixo Y)
     Vout_max_global = float(np.max(max_curve_Vout)) if max_curve_Vout.size > 0 else 0.0
 
+    # A malha do cache é compartilhada e somente-leitura: quem chama recebe
+    # uma cópia própria (O(N), desprezível perto das curvas acima)
     return (
-        freqs,
+        freqs.copy(),
         nom_curve_Vout,
         min_curve_Vout,
         max_curve_Vout,
@@ -503,6 +523,18 @@ def simulate_response_with_tolerances(
 # CÁLCULO REVERSO: PROJETAR L E C PARA UM f0 ALVO
 # ============================================================
 
+# Grades padrão (E12) de candidatos, montadas uma vez na importação.
+# Ordem: década externa, valor E12 interno.
+_E12 = np.array([1.0, 1.2, 1.5, 1.8, 2.2, 2.7, 3.3, 3.9, 4.7, 5.6, 6.8, 8.2])
+
+# L: 0.1 mH ... 100 mH (décadas 10^-4, 10^-3, 10^-2 H)
+_E12_L_GRID_H = (_E12[None, :] * 10.0 ** np.arange(-4, -1)[:, None]).ravel()
+# C: 100 pF ... 1 µF (décadas 10^-10 ... 10^-6 F)
+_E12_C_GRID_F = (_E12[None, :] * 10.0 ** np.arange(-10, -5)[:, None]).ravel()
+
+_E12_L_GRID_H.setflags(write=False)
+_E12_C_GRID_F.setflags(write=False)
+
 def design_rlc_for_target_f0(
     target_f0_hz,
     R_fixed=None,
@@ -548,25 +580,12 @@ def design_rlc_for_target_f0(
         raise ValueError("target_f0_hz deve ser > 0.")
 
     # ------------------------------
-    # 1) Gera listas padrão (E12-like) se não forem fornecidas
+    # 1) Usa as grades padrão (E12) se as listas não forem fornecidas
     # ------------------------------
-    E12 = np.array([1.0, 1.2, 1.5, 1.8, 2.2, 2.7, 3.3, 3.9, 4.7, 5.6, 6.8, 8.2])
-
     if L_candidates_h is None:
-        # Faixa típica: 0.1 mH ... 100 mH
-        decades_L = np.array([-4, -3, -2])  # 10^-4, 10^-3, 10^-2 H
-        vals_L = []
-        for d in decades_L:
-            vals_L.extend(E12 * (10.0 ** d))
-        L_candidates_h = np.array(vals_L, dtype=float)
-
+        L_candidates_h = _E12_L_GRID_H
     if C_candidates_f is None:
-        # Faixa típica: 100 pF ... 1 µF
-        decades_C = np.array([-10, -9, -8, -7, -6])  # 10^-10 ... 10^-6 F
-        vals_C = []
-        for d in decades_C:
-            vals_C.extend(E12 * (10.0 ** d))
-        C_candidates_f = np.array(vals_C, dtype=float)
+        C_candidates_f = _E12_C_GRID_F
 
     L_candidates_h = np.asarray(L_candidates_h, dtype=float)
     C_candidates_f = np.asarray(C_candidates_f, dtype=float)
@@ -579,48 +598,57 @@ def design_rlc_for_target_f0(
         raise ValueError("Listas de candidatos L/C vazias após filtragem.")
 
     # ------------------------------
-    # 2) Varre todas as combinações
+    # 2) Avalia todas as combinações de uma vez (grade L x C por broadcasting)
     # ------------------------------
-    results = []
-    for L in L_candidates_h:
-        for C in C_candidates_f:
-            try:
-                f0_calc = 1.0 / (2.0 * np.pi * np.sqrt(L * C))
-            except FloatingPointError:
-                continue
-
-            if not np.isfinite(f0_calc) or f0_calc <= 0:
-                continue
-
-            error_pct = abs(f0_calc - target_f0_hz) / target_f0_hz * 100.0
-
-            if (max_error_pct is not None) and (error_pct > max_error_pct):
-                continue
-
-            if R_fixed is not None and R_fixed > 0:
-                Q = (1.0 / R_fixed) * np.sqrt(L / C)
-            else:
-                Q = None
-
-            results.append(
-                {
-                    "L_H": float(L),
-                    "C_F": float(C),
-                    "f0_calc_Hz": float(f0_calc),
-                    "error_pct": float(error_pct),
-                    "Q": None if Q is None else float(Q),
-                }
-            )
+    L_grid = L_candidates_h[:, None]
+    C_grid = C_candidates_f[None, :]
 
-    # ------------------------------
-    # 3) Ordena por erro (asc) e depois por Q (desc)
-    # ------------------------------
-    if not results:
+    with np.errstate(all="ignore"):
+        f0_calc = 1.0 / (2.0 * np.pi * np.sqrt(L_grid * C_grid))
+    error_pct = np.abs(f0_calc - target_f0_hz) / target_f0_hz * 100.0
+
+    valid = np.isfinite(f0_calc) & (f0_calc > 0)
+    if max_error_pct is not None:
+        valid &= error_pct <= max_error_pct
+
+    # Índices planos (ordem L externo, C interno) das combinações aceitas
+    idx = np.flatnonzero(valid)
+    if idx.size == 0:
         return []
 
-    def sort_key(d):
-        q = d["Q"] if d["Q"] is not None else 0.0
-        return (d["error_pct"], -q)
+    iL, iC = np.unravel_index(idx, valid.shape)
+    L_sel = L_candidates_h[iL]
+    C_sel = C_candidates_f[iC]
+    err_sel = error_pct.ravel()[idx]
 
-    results.sort(key=sort_key)
-    return results[:max_results]
\ No newline at end of file
+    if R_fixed is not None and R_fixed > 0:
+        Q_sel = (1.0 / R_fixed) * np.sqrt(L_sel / C_sel)
+    else:
+        Q_sel = None
+
+    # ------------------------------
+    # 3) Ordena por erro (asc) e depois por Q (desc)
+    # ------------------------------
+    # Com muitas combinações, argpartition separa antes as max_results de
+    # menor erro (mantendo empates no limite), e só essas são ordenadas.
+    if max_results is not None and 0 < max_results < err_sel.size:
+        kth = err_sel[np.argpartition(err_sel, max_results - 1)[max_results - 1]]
+        keep = np.flatnonzero(err_sel <= kth)
+        L_sel, C_sel, err_sel, idx = L_sel[keep], C_sel[keep], err_sel[keep], idx[keep]
+        if Q_sel is not None:
+            Q_sel = Q_sel[keep]
+
+    q_key = Q_sel if Q_sel is not None else np.zeros_like(err_sel)
+    order = np.lexsort((-q_key, err_sel))[:max_results]  # lexsort é estável
+
+    f0_flat = f0_calc.ravel()
+    return [
+        {
+            "L_H": float(L_sel[i]),
+            "C_F": float(C_sel[i]),
+            "f0_calc_Hz": float(f0_flat[idx[i]]),
+            "error_pct": float(err_sel[i]),
+            "Q": None if Q_sel is None else float(Q_sel[i]),
+        }
+        for i in order
+    ]
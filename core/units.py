@@ -57,13 +57,20 @@ FREQUENCY_UNITS = {
     "GHz": 1e9,
 }
 
+# =============================
+# Tabela única de multiplicadores
+# =============================
+# Todas as unidades acima num só dicionário. Os símbolos não se repetem
+# entre tabelas; ainda assim, a ordem dos update() preserva a prioridade
+# da busca original (R, depois L, C e por fim frequência).
+UNIT_MULTIPLIERS = {}
+for _table in (FREQUENCY_UNITS, CAPACITOR_UNITS, INDUCTOR_UNITS, RESISTOR_UNITS):
+    UNIT_MULTIPLIERS.update(_table)
+del _table
+
 # =============================
 # Função genérica de multiplicador
 # =============================
 def get_multiplier(unit: str) -> float:
     """Retorna o multiplicador numérico baseado na unidade fornecida."""
-    # busca em todos os dicionários
-    for table in (RESISTOR_UNITS, INDUCTOR_UNITS, CAPACITOR_UNITS, FREQUENCY_UNITS):
-        if unit in table:
-            return table[unit]
-    return 1.0
+    return UNIT_MULTIPLIERS.get(unit, 1.0)
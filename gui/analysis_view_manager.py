@@ -872,13 +872,31 @@ class AnalysisViewManager(ctk.CTkFrame):
     # ----------------------------------------------------------------------
     # Plot
     # ----------------------------------------------------------------------
+    def _clear_plot_artists(self):
+        """
+        Remove só o que plot_curves recria (linhas, coleções e legendas),
+        mantendo eixos, ticks, spines e grade — ao contrário de ax.clear(),
+        que obriga o matplotlib a reconstruir tudo a cada replot.
+        """
+        # A legenda "Curvas" pode ser ax.legend_ e também filha via add_artist:
+        # nesse caso já sai no laço abaixo e só falta soltar a referência
+        legend = self.ax.get_legend()
+        legend_in_artists = legend is not None and legend in self.ax.artists
+        for artist in [*self.ax.lines, *self.ax.collections, *self.ax.artists]:
+            artist.remove()
+        if legend_in_artists:
+            self.ax.legend_ = None
+        elif legend is not None:
+            legend.remove()
+        self.ax.axis("on")
+
     def plot_curves(self, focused_key=None):
-        self.ax.clear()
+        self._clear_plot_artists()
 
         if not self.active_curves:
             self.ax.set_title("Nenhum Dado para Análise.", color="gray")
             self.ax.axis("off")
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
 
         if focused_key is not None:
@@ -1092,7 +1110,8 @@ class AnalysisViewManager(ctk.CTkFrame):
                 title="Marcadores",
             )
 
-        self.canvas.draw()
+        # draw_idle: vários replots seguidos (checkboxes, foco) viram um desenho só
+        self.canvas.draw_idle()
 
     # ----------------------------------------------------------------------
     # Reconstrução teórica
@@ -5,11 +5,46 @@ import os
 import pandas as pd
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
+from matplotlib.animation import FuncAnimation
 from core.experiment_worker import ExperimentWorker
 import tkinter.messagebox as msgbox
 from tkinter import filedialog
 import numpy as np
 
+
+def _argmin_abs_diff(values, target):
+    """Índice do elemento de `values` mais próximo de `target` (um só buffer temporário)."""
+    buf = np.subtract(values, target)
+    np.abs(buf, out=buf)
+    return int(buf.argmin())
+
+
+def _nearest_crossing(gain, target, rising):
+    """
+    Índice de `gain` mais próximo de `target` num flanco da ressonância.
+
+    Se o flanco for monótono (crescente antes de f0, decrescente depois),
+    usa busca binária; senão (ruído de medição) cai no argmin linear.
+    """
+    key = gain if rising else gain[::-1]
+    if not np.all(key[1:] >= key[:-1]):
+        return _argmin_abs_diff(gain, target)
+
+    j = int(np.searchsorted(key, target))
+    if j == 0:
+        best = key[0]
+    elif j == key.size:
+        best = key[-1]
+    else:
+        # Vizinhos j-1 e j; empates ficam com o menor índice original (como o argmin)
+        below, above = target - key[j - 1], key[j] - target
+        best = key[j] if (above < below if rising else above <= below) else key[j - 1]
+
+    if rising:
+        return int(np.searchsorted(key, best, side='left'))
+    return gain.size - int(np.searchsorted(key, best, side='right'))
+
+
 class TabExperiment:
     def __init__(self, parent_frame, conn_manager, data_manager):
         self.parent = parent_frame
@@ -18,6 +53,9 @@ class TabExperiment:
         self.data_manager = data_manager
         self.last_results = None 
         self.last_metrics = {} # CORREÇÃO: Inicializar a variável
+        self._pending = False # Redesenho já agendado no loop do Tk
+        self._anim = None # Animação (blit) ativa durante o sweep
+        self._params = {} # Parâmetros do último sweep (já convertidos)
 
         self.parent.grid_columnconfigure(1, weight=1)
         self.parent.grid_rowconfigure(0, weight=1)
@@ -35,23 +73,31 @@ class TabExperiment:
         
     def _analyze_sweep_data(self, df):
         """Calcula f0, Q, BW, f1, f2 a partir dos dados brutos do sweep."""
-        if df.empty:
+        freq = df['Frequency'].to_numpy(dtype=float)
+        v = df['V_Resistor'].to_numpy(dtype=float)
+        v_in = float(self._params.get('V_in', 0))
+
+        # Casos degenerados (sem dados, Vin nulo ou curva constante): nada a medir
+        if v.size == 0 or v_in == 0 or np.ptp(v) == 0:
             return {'f0': 0, 'Q': 0, 'BW': 0, 'f1': 0, 'f2': 0}
+
+        # Com os pontos ordenados em frequência, "abaixo/acima de f0" viram fatias
+        # (views) do vetor em vez de máscaras que copiam o DataFrame inteiro
+        # (um sweep já chega em ordem crescente; só reordena dados importados)
+        if np.any(freq[1:] < freq[:-1]):
+            order = np.argsort(freq, kind='stable')
+            freq = freq[order]
+            v = v[order]
+        gain = v / v_in
             
-        max_v = df['V_Resistor'].max()
-        v_in = float(self.entry_vin.get())
-        max_gain = max_v / v_in
-        
-        f0_idx = df['V_Resistor'].idxmax()
-        f0_exp = df.loc[f0_idx, 'Frequency']
+        i0 = int(gain.argmax())
+        f0_exp = float(freq[i0])
         
-        target_gain = max_gain / np.sqrt(2)
+        target_gain = gain[i0] / np.sqrt(2)
         
-        df_low = df[df['Frequency'] < f0_exp]
-        f1_exp = df_low.loc[(np.abs(df_low['V_Resistor'] / v_in - target_gain)).idxmin(), 'Frequency'] if not df_low.empty else 0
+        f1_exp = float(freq[_nearest_crossing(gain[:i0], target_gain, rising=True)]) if i0 > 0 else 0
         
-        df_high = df[df['Frequency'] > f0_exp]
-        f2_exp = df_high.loc[(np.abs(df_high['V_Resistor'] / v_in - target_gain)).idxmin(), 'Frequency'] if not df_high.empty else 0
+        f2_exp = float(freq[i0 + 1 + _nearest_crossing(gain[i0 + 1:], target_gain, rising=False)]) if i0 < gain.size - 1 else 0
         
         BW_exp = f2_exp - f1_exp
         Q_exp = f0_exp / BW_exp if BW_exp > 0 else 0
@@ -146,6 +192,7 @@ class TabExperiment:
     def experiment_finished(self, results):
         """Chamado quando termina a coleta de dados."""
         self.last_results = results 
+        self._stop_animation()
         
         if results:
             df = pd.DataFrame(results, columns=['Frequency', 'V_Resistor'])
@@ -175,15 +222,11 @@ class TabExperiment:
         if file_path:
             exp_name = os.path.basename(file_path).replace('.csv', '').replace('.CSV', '')
             
-            metadata = {
-                'R_nominal': self.entry_start.get(), 
-                'Start_Freq': self.entry_start.get(),
-                'Stop_Freq': self.entry_stop.get(), 
-                'Steps': self.entry_step.get(),
-                'C_usado': 'C1 (Capacitor Manual)', 
-                'V_in': self.entry_vin.get(),
-                'metrics': self.last_metrics 
-            }
+            # Usa o snapshot do início do sweep (sem reler os entries)
+            metadata = {'R_nominal': self._params['Start_Freq']}
+            metadata.update(self._params)
+            metadata['C_usado'] = 'C1 (Capacitor Manual)'
+            metadata['metrics'] = self.last_metrics
             
             try:
                 self.data_manager.save_experiment(exp_name, self.last_results, metadata)
@@ -218,8 +261,10 @@ class TabExperiment:
         self.toolbar.pack(side='bottom', fill='x', padx=10, pady=5) 
         self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
 
-        self.x_data = []
-        self.y_data = []
+        # Buffers pré-alocados a cada sweep; self._n = pontos já recebidos
+        self.x_data = np.empty(0)
+        self.y_data = np.empty(0)
+        self._n = 0
         self.line, = self.ax.plot([], [], 'o-', color='gold', linewidth=1.5, markersize=4)
 
     def start_experiment_logic(self):
@@ -259,34 +304,79 @@ class TabExperiment:
             return
 
         # Prepara UI
+        self._params = {'Start_Freq': start, 'Stop_Freq': stop, 'Steps': steps, 'V_in': vin}
         self.btn_run.configure(state="disabled")
         self.btn_stop.configure(state="normal")
         self.btn_save.configure(state="disabled")
-        self.x_data.clear()
-        self.y_data.clear()
+        self.x_data = np.empty(steps)
+        self.y_data = np.empty(steps)
+        self._n = 0
         self.line.set_data([], [])
+
+        # A animação só começa no próximo draw_event, por isso vem antes do draw
+        self.line.set_animated(True)
+        self._anim = FuncAnimation(
+            self.fig, self._animate, interval=50, blit=True, cache_frame_data=False
+        )
         self.canvas.draw()
 
         # Inicia Thread
         self.worker = ExperimentWorker(
             self.manager, start, stop, steps, vin,
             callback_step=self.update_plot_step,
-            callback_finish=self.experiment_finished
+            # Também volta para o loop do Tk (mantém a ordem em relação aos pontos)
+            callback_finish=lambda results: self.parent.after(0, self.experiment_finished, results)
         )
         self.worker.start()
 
     def update_plot_step(self, data_point, progress):
-        """Chamado pela Thread a cada ponto novo"""
-        freq, vpp = data_point
-        self.x_data.append(freq)
-        self.y_data.append(vpp)
+        """Chamado pela Thread a cada ponto novo: repassa o ponto ao loop do Tk."""
+        self.parent.after(0, self._apply_point, data_point, progress)
+
+    def _apply_point(self, data_point, progress):
+        """Roda no loop do Tk: guarda o ponto e agenda um único redesenho."""
+        if self._n < self.x_data.size:
+            self.x_data[self._n], self.y_data[self._n] = data_point
+            self._n += 1
         
         self.progress_bar.set(progress)
 
-        self.line.set_data(self.x_data, self.y_data)
+        # Vários pontos no mesmo ciclo do Tk viram um só redesenho
+        if not self._pending:
+            self._pending = True
+            self.parent.after_idle(self._flush_plot)
+
+    def _flush_plot(self):
+        """Reajusta os eixos; a linha em si é desenhada pela animação (blit)."""
+        self._pending = False
+        n = self._n
+        self.line.set_data(self.x_data[:n], self.y_data[:n])
+
+        limits = (self.ax.get_xlim(), self.ax.get_ylim())
         self.ax.relim() 
         self.ax.autoscale_view() 
-        self.canvas.draw_idle() 
+        if (self.ax.get_xlim(), self.ax.get_ylim()) == limits:
+            return
+
+        if self._anim is not None:
+            # Redesenho completo (sem a linha animada) para o blit recapturar o fundo
+            self.canvas.draw()
+        else:
+            self.canvas.draw_idle() 
+
+    def _animate(self, _frame):
+        n = self._n
+        self.line.set_data(self.x_data[:n], self.y_data[:n])
+        return (self.line,)
+
+    def _stop_animation(self):
+        """Encerra o blit e devolve a linha ao desenho normal do canvas."""
+        if self._anim is not None:
+            self._anim.event_source.stop()
+            self._anim = None
+        self.line.set_animated(False)
+        self._flush_plot()
+        self.canvas.draw_idle()
 
     def stop_experiment(self):
         if self.worker:
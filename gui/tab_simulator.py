@@ -1,26 +1,201 @@
 import customtkinter as ctk
+import math
 import numpy as np
-import matplotlib.pyplot as plt
 import os
-from tkinter import filedialog
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib import rc_context
+from matplotlib.collections import PolyCollection
 from matplotlib.figure import Figure
 import tkinter.messagebox as msgbox
 
 from gui.ui_helpers import ToolTip
 from gui.plot_utils import setup_frequency_axis, format_frequency_for_unit
-from core.rlc_theory import simulate_response_with_tolerances, design_rlc_for_target_f0
+from core.rlc_theory import simulate_response_with_tolerances
 from core.units import (
     get_multiplier,
     RESISTOR_UNITS,
     INDUCTOR_UNITS,
     CAPACITOR_UNITS,
     FREQUENCY_UNITS,
+    UNIT_MULTIPLIERS,
 )
 
 # Opções de unidade para faixa de frequência (derivadas do units.py)
 FREQ_OPTIONS = list(FREQUENCY_UNITS.keys())
 
+# Tema escuro do gráfico, aplicado só na criação dos artistas (rc_context),
+# em vez de plt.style.use, que reprocessa o estilo e altera o rcParams global.
+_DARK_RC = {
+    "axes.facecolor": "#242424",
+    "figure.facecolor": "#242424",
+    "axes.edgecolor": "white",
+    "xtick.color": "white",
+    "ytick.color": "white",
+    "axes.labelcolor": "white",
+    "text.color": "white",
+}
+
+# Conteúdo dos popups de informação dos cards: métrica -> (título, texto)
+_INFO_POPUP_CONTENT = {
+    "f0": (
+        "Frequência de Ressonância (f₀)",
+        (
+            "A frequência de ressonância f₀ é o ponto em que o circuito RLC série\n"
+            "apresenta máxima transferência de energia para o resistor.\n\n"
+            "No circuito RLC série ideal (R em série com L e C), f₀ depende apenas\n"
+            "de L e C, dada por:\n\n"
+            "    f₀ = 1 / (2·π·√(L·C))\n\n"
+            "Em termos físicos:\n"
+            "  • A reatância indutiva:   X_L = 2·π·f·L   (cresce com a frequência)\n"
+            "  • A reatância capacitiva: X_C = 1 / (2·π·f·C)   (decresce com a frequência)\n\n"
+            "Em f₀ temos X_L = X_C, as reatâncias se cancelam e o circuito é puramente\n"
+            "resistivo.\n\n"
+            "Neste ponto, a corrente é máxima e a tensão medida no resistor atinge o\n"
+            "valor máximo para uma dada tensão de entrada."
+        ),
+    ),
+    "Q": (
+        "Fator de Qualidade (Q)",
+        (
+            "O fator de qualidade Q mede quão seletivo é o circuito em torno da\n"
+            "frequência de ressonância f₀.\n\n"
+            "Para o RLC série, vale:\n\n"
+            "    Q = (1 / R) · √(L / C)\n\n"
+            "Interpretação:\n"
+            "  • Q alto  → pico de ressonância estreito e mais alto (mais seletivo).\n"
+            "  • Q baixo → resposta mais larga e menos pronunciada.\n\n"
+            "Q se relaciona com a largura de banda BW por:\n\n"
+            "    Q = f₀ / BW\n\n"
+            "onde BW = f₂ − f₁ e f₁, f₂ são as frequências de meia-potência\n"
+            "(pontos em que a potência cai para metade do valor máximo,\n"
+            "ou seja, |V| ≈ 0,707·|Vₘₐₓ|)."
+        ),
+    ),
+    "BW": (
+        "Largura de Banda (BW)",
+        (
+            "A largura de banda BW indica a faixa de frequências em torno de f₀\n"
+            "onde o circuito ainda apresenta ganho significativo.\n\n"
+            "Definição de meia-potência:\n\n"
+            "    BW = f₂ − f₁\n\n"
+            "onde f₁ e f₂ são as frequências em que a potência cai para metade do\n"
+            "valor máximo.\n\n"
+            "No RLC série, vale ainda a relação:\n\n"
+            "    BW = f₀ / Q\n\n"
+            "Assim:\n"
+            "  • Q alto  → BW estreita (circuito bem seletivo).\n"
+            "  • Q baixo → BW larga (resposta mais espalhada em frequência)."
+        ),
+    ),
+}
+
+
+# Entradas aceitam vírgula decimal ("4,7")
+_COMMA_TO_DOT = str.maketrans({",": "."})
+
+
+def _parse_number(text: str) -> float:
+    """float() de um texto de entrada, aceitando vírgula como separador decimal."""
+    if "," in text:
+        text = text.translate(_COMMA_TO_DOT)
+    return float(text)
+
+
+def _quantize(value, digits: int = 6):
+    """
+    Arredonda para `digits` algarismos significativos, para que valores
+    vindos do slider log (com ruído de ponto flutuante) virem a mesma
+    chave de cache. None passa direto (faixa de frequência automática).
+    """
+    if value is None:
+        return None
+    return float(f"{value:.{digits}g}")
+
+
+@lru_cache(maxsize=64)
+def _simulate_cached(R_nom, L_nom, C_nom, tol_R, tol_L, tol_C, V_in_plot, freq_min, freq_max):
+    """
+    simulate_response_with_tolerances memoizada (chamar com valores já
+    quantizados). Os vetores devolvidos são compartilhados entre chamadas
+    e por isso ficam somente-leitura.
+    """
+    (
+        freqs,
+        nom_curve_Vout,
+        min_curve_Vout,
+        max_curve_Vout,
+        metrics_nom,
+        ranges,
+        Vout_max_global,
+    ) = simulate_response_with_tolerances(
+        R_nom=R_nom,
+        L_nom=L_nom,
+        C_nom=C_nom,
+        tol_R=tol_R,
+        tol_L=tol_L,
+        tol_C=tol_C,
+        V_in_plot=V_in_plot,
+        freq_min=freq_min,
+        freq_max=freq_max,
+    )
+    for arr in (freqs, nom_curve_Vout, min_curve_Vout, max_curve_Vout):
+        arr.setflags(write=False)
+    return (
+        freqs,
+        nom_curve_Vout,
+        min_curve_Vout,
+        max_curve_Vout,
+        metrics_nom,
+        ranges,
+        Vout_max_global,
+    )
+
+
+@lru_cache(maxsize=64)
+def _design_cached(target_f0_hz, R_fixed, L_tup, C_tup, max_results, max_error_pct):
+    """
+    design_rlc_for_target_f0 memoizada para a calculadora de projeto
+    inverso: CALCULAR repetido com as mesmas entradas não refaz a varredura.
+
+    L_tup / C_tup são tuplas de candidatos (ou None = grade padrão E12).
+    O resultado é compartilhado entre chamadas: devolvido como tupla e
+    tratado como somente-leitura.
+    """
+    # Import tardio: só é necessário quando a calculadora é usada
+    from core.rlc_theory import design_rlc_for_target_f0
+
+    return tuple(
+        design_rlc_for_target_f0(
+            target_f0_hz=target_f0_hz,
+            R_fixed=R_fixed,
+            L_candidates_h=L_tup,
+            C_candidates_f=C_tup,
+            max_results=max_results,
+            max_error_pct=max_error_pct,
+        )
+    )
+
+
+# (limiar, unidade) em ordem decrescente para _format_freq_eng
+_FREQ_UNITS = ((1e9, "GHz"), (1e6, "MHz"), (1e3, "kHz"), (1.0, "Hz"))
+
+
+@lru_cache(maxsize=256)
+def _format_freq_eng_cached(f_hz):
+    """
+    Texto de TabSimulator._format_freq_eng, memoizado pelo valor exato:
+    os valores vêm do cache de simulação e se repetem entre atualizações.
+    """
+    if f_hz is None or f_hz <= 0:
+        return "---"
+
+    for threshold, unit in _FREQ_UNITS:
+        if f_hz >= threshold:
+            return f"{f_hz / threshold:.2f} {unit}"
+    return f"{f_hz:.2f} Hz"
+
 
 class TabSimulator:
     LATEX_F0 = r'$f_0 = \frac{1}{2\pi\sqrt{LC}}$'
@@ -52,6 +227,11 @@ class TabSimulator:
         self.RANGE_FACTOR_BELOW = 10.0
         self.RANGE_FACTOR_ABOVE = 10.0
 
+        # Expoentes log10 dos extremos do range (fixos; evita recalcular por evento)
+        self._log_fmin = math.log10(1.0 / self.RANGE_FACTOR_BELOW)
+        self._log_fmax = math.log10(self.RANGE_FACTOR_ABOVE)
+        self._log_span = self._log_fmax - self._log_fmin
+
         # Métricas nominais auxiliares
         self.f1_nom = 0.0
         self.f2_nom = 0.0
@@ -66,6 +246,29 @@ class TabSimulator:
         self.last_nom_curve_Vout = None
         self.last_V_in_plot = None
 
+        # Pares (L, C) das linhas da calculadora de projeto inverso
+        self._row_data = {}
+
+        # Simulação agendada (debounce dos sliders/checkboxes)
+        self._pending_sim_id = None
+
+        # Cálculo numérico dos sliders fora da thread da GUI (um worker só)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._inflight = None
+
+        # Entradas (quantizadas) da última simulação aplicada ao gráfico
+        self._last_sim_key = None
+
+        # Faixa (Hz) e (fator, unidade) do eixo X configurado por último
+        self._freq_span = None
+        self._freq_axis = None
+
+        # Contador de eventos de arraste: só 1 a cada 3 agenda simulação
+        self._drag_tick = 0
+
+        # Último passo (0..100) visto em cada slider: eventos repetidos são ignorados
+        self._last_step = {"R": None, "L": None, "C": None}
+
         # Flags de visualização
         self.show_tolerance = ctk.BooleanVar(value=True)
         self.show_f0 = ctk.BooleanVar(value=True)
@@ -99,11 +302,13 @@ class TabSimulator:
 
     def _init_plot(self):
 
-        plt.style.use('dark_background')
-        self.fig = Figure(figsize=(5, 4), dpi=100)
-        self.fig.patch.set_facecolor('#242424')
-        self.ax = self.fig.add_subplot(111)
+        with rc_context(_DARK_RC):
+            self.fig = Figure(figsize=(5, 4), dpi=100)
+            self.ax = self.fig.add_subplot(111)
+        self.fig.set_facecolor('#242424')
         self.ax.set_facecolor('#242424')
+        # Ticks são criados sob demanda (fora do rc_context): cor fixada aqui
+        self.ax.tick_params(which="both", colors="white")
 
         # ====== CARDS DE RESULTADOS ======
         self.metrics_frame = ctk.CTkFrame(
@@ -116,173 +321,124 @@ class TabSimulator:
         # 4 colunas com mesmo peso e mesmo “grupo” de largura
         self.metrics_frame.grid_columnconfigure((0, 1, 2, 3), weight=1, uniform="metrics")
 
-        # ---- Card f0 ----
-        card_f0 = ctk.CTkFrame(
-            self.metrics_frame,
-            fg_color=("#2E2E2E", "#2E2E2E"),
-            corner_radius=8,
-        )
-        card_f0.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-        card_f0.grid_columnconfigure(0, weight=1)
-
-        header_f0 = ctk.CTkFrame(card_f0, fg_color="transparent")
-        header_f0.grid(row=0, column=0, sticky="ew", padx=10, pady=(8, 0))
-        header_f0.grid_columnconfigure(0, weight=1)
-
-        title_f0 = ctk.CTkLabel(
-            header_f0,
-            text="Frequência de Ressonância (f₀)",
-            font=("Arial", 12, "bold"),
-        )
-        title_f0.grid(row=0, column=0, sticky="w")
-
-        info_f0 = ctk.CTkLabel(
-            header_f0,
-            text="i",
-            width=20,
-            height=20,
-            corner_radius=10,
-            fg_color="#444444",
-            font=("Arial", 13, "bold"),
+        self.lbl_f0_nom = self._make_card(
+            0,
+            "Frequência de Ressonância (f₀)",
+            tooltip_text="Clique aqui para ver detalhes.",
+            info_key="f0",
+            var=self.show_f0,
+            chk_text="Mostrar f₀",
         )
-        info_f0.grid(row=0, column=1, padx=(6, 0))
-        ToolTip(info_f0, "Clique aqui para ver detalhes.")
-        info_f0.bind("<Button-1>", lambda e: self._open_info_popup("f0"))
-
-        self.lbl_f0_nom = ctk.CTkLabel(
-            card_f0,
-            text="---",
-            font=("Arial", 18, "bold"),
-            text_color="#4da6ff",
+        self.lbl_f1f2 = self._make_card(
+            1,
+            "Frequências de Meia Potência (f₁, f₂)",
+            tooltip_text=(
+                "f₁ e f₂: frequências de meia potência (ganho ≈ 0,707 do máximo).\n"
+                "BW = f₂ - f₁."
+            ),
+            var=self.show_f1f2,
+            chk_text="Mostrar f₁ / f₂",
+            value_font_size=16,
         )
-        self.lbl_f0_nom.grid(row=1, column=0, pady=(6, 4), padx=10, sticky="n")
-
-        chk_f0 = ctk.CTkCheckBox(
-            card_f0,
-            text="Mostrar f₀",
-            variable=self.show_f0,
-            command=self.run_simulation,
-            font=("Arial", 11),
+        self.lbl_q_nom = self._make_card(2, "Fator de Qualidade (Q)")
+        self.lbl_bw_nom = self._make_card(
+            3,
+            "Largura de Banda (BW)",
+            tooltip_text="Clique aqui para ver detalhes.",
+            info_key="BW",
+            value_pady=(6, 8),
         )
-        chk_f0.grid(row=2, column=0, pady=(0, 8), padx=10, sticky="w")
 
-        # ---- Card f1 / f2 ----
-        card_f1f2 = ctk.CTkFrame(
-            self.metrics_frame,
-            fg_color=("#2E2E2E", "#2E2E2E"),
-            corner_radius=8,
+        # ====== ARTISTAS PERSISTENTES ======
+        # Criados uma vez e atualizados com set_data; por serem "animated",
+        # ficam fora do desenho completo e são redesenhados por blit.
+        self.ax.grid(True, which="both", color="white", alpha=0.3)
+        self._line_max, = self.ax.plot(
+            [], [], color='lime', linestyle='--', linewidth=1, alpha=0.6, animated=True
         )
-        card_f1f2.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
-        card_f1f2.grid_columnconfigure(0, weight=1)
-
-        header_f1f2 = ctk.CTkFrame(card_f1f2, fg_color="transparent")
-        header_f1f2.grid(row=0, column=0, sticky="ew", padx=10, pady=(8, 0))
-        header_f1f2.grid_columnconfigure(0, weight=1)
-
-        title_f1f2 = ctk.CTkLabel(
-            header_f1f2,
-            text="Frequências de Meia Potência (f₁, f₂)",
-            font=("Arial", 12, "bold"),
+        self._line_min, = self.ax.plot(
+            [], [], color='orangered', linestyle='--', linewidth=1, alpha=0.6, animated=True
         )
-        title_f1f2.grid(row=0, column=0, sticky="w")
-
-        info_f1f2 = ctk.CTkLabel(
-            header_f1f2,
-            text="i",
-            width=20,
-            height=20,
-            corner_radius=10,
-            fg_color="#444444",
-            font=("Arial", 13, "bold"),
+        self._line_nom, = self.ax.plot(
+            [], [], color='gold', linewidth=2.5, label='Nominal', animated=True
         )
-        info_f1f2.grid(row=0, column=1, padx=(6, 0))
-        ToolTip(
-            info_f1f2,
-            "f₁ e f₂: frequências de meia potência (ganho ≈ 0,707 do máximo).\n"
-            "BW = f₂ - f₁.",
+        # Marcadores f0/f1/f2: posição definida a cada simulação com set_xdata
+        self._vline_f0 = self.ax.axvline(np.nan, color='red', alpha=0.8, label='f0', animated=True)
+        self._vline_f1 = self.ax.axvline(np.nan, color='aqua', alpha=0.7, label='f1', animated=True)
+        self._vline_f2 = self.ax.axvline(np.nan, color='aqua', alpha=0.7, label='f2', animated=True)
+        self.ax.title.set_animated(True)
+
+        # Banda de tolerância: polígono único, vértices trocados com set_verts
+        self._tol_band = PolyCollection(
+            [],
+            color='aliceblue',
+            alpha=0.1,
+            label='Incerteza Tolerância',
+            animated=True,
         )
+        self.ax.add_collection(self._tol_band, autolim=False)
 
-        # valor central do card (texto f₁ e f₂)
-        self.lbl_f1f2 = ctk.CTkLabel(
-            card_f1f2,
-            text="---",
-            font=("Arial", 16, "bold"),
-            text_color="#4da6ff",
-        )
-        self.lbl_f1f2.grid(row=1, column=0, pady=(6, 4), padx=10, sticky="n")
+        # Fundo (sem artistas animados) e layout dos eixos usados no blit
+        self._bg = None
+        self._layout_key = None
 
-        # checkbox alinhado na MESMA linha (row=2) dos outros cards
-        chk_f1f2 = ctk.CTkCheckBox(
-            card_f1f2,
-            text="Mostrar f₁ / f₂",
-            variable=self.show_f1f2,
-            command=self.run_simulation,
-            font=("Arial", 11),
+        # ====== FIGURA ======
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.view_area)
+        self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
+        self.canvas.draw_idle()
+        self.toolbar = NavigationToolbar2Tk(
+            self.canvas, self.view_area, pack_toolbar=False
         )
-        chk_f1f2.grid(row=2, column=0, pady=(0, 8), padx=10, sticky="w")
+        self.toolbar.update()
 
-        # ---- Card Q ----
-        card_q = ctk.CTkFrame(
-            self.metrics_frame,
-            fg_color=("#2E2E2E", "#2E2E2E"),
-            corner_radius=8,
+        self.toolbar.pack(side='bottom', fill='x', padx=10, pady=5)
+        self.canvas.get_tk_widget().pack(
+            side="top", fill="both", expand=True, padx=10, pady=(5, 10)
         )
-        card_q.grid(row=0, column=2, sticky="nsew", padx=5, pady=5)
-        card_q.grid_columnconfigure(0, weight=1)
 
-        header_q = ctk.CTkFrame(card_q, fg_color="transparent")
-        header_q.grid(row=0, column=0, sticky="ew", padx=10, pady=(8, 0))
-        header_q.grid_columnconfigure(0, weight=1)
-
-        title_q = ctk.CTkLabel(
-            header_q,
-            text="Fator de Qualidade (Q)",
-            font=("Arial", 12, "bold"),
-        )
-        title_q.grid(row=0, column=0, sticky="w")
+    # ==================== CONTROLES / SLIDERS ====================
 
-        info_q = ctk.CTkLabel(
-            header_q,
-            text="i",
-            width=20,
-            height=20,
-            corner_radius=10,
-            fg_color="#444444",
-            font=("Arial", 13, "bold"),
-        )
-        info_q.grid(row=0, column=1, padx=(6, 0))
-        # ToolTip(info_q, "…")  # já tinha
+    def _make_card(
+        self,
+        col,
+        title,
+        tooltip_text=None,
+        info_key=None,
+        var=None,
+        chk_text=None,
+        value_font_size=18,
+        value_pady=(6, 4),
+    ):
+        """
+        Cria um card de métrica na coluna `col` de metrics_frame:
+        cabeçalho com título e ícone "i", label de valor e, se `var` for
+        dado, checkbox de visibilidade ligado a _refresh_overlays.
 
-        self.lbl_q_nom = ctk.CTkLabel(
-            card_q,
-            text="---",
-            font=("Arial", 18, "bold"),
-            text_color="#4da6ff",
-        )
-        self.lbl_q_nom.grid(row=1, column=0, pady=(6, 4), padx=10, sticky="n")
+        - tooltip_text: texto do ToolTip do ícone (None = sem tooltip);
+        - info_key: métrica aberta em _open_info_popup ao clicar no ícone.
 
-        # ---- Card BW ----
-        card_bw = ctk.CTkFrame(
+        Retorna o label de valor do card.
+        """
+        card = ctk.CTkFrame(
             self.metrics_frame,
             fg_color=("#2E2E2E", "#2E2E2E"),
             corner_radius=8,
         )
-        card_bw.grid(row=0, column=3, sticky="nsew", padx=5, pady=5)
-        card_bw.grid_columnconfigure(0, weight=1)
+        card.grid(row=0, column=col, sticky="nsew", padx=5, pady=5)
+        card.grid_columnconfigure(0, weight=1)
 
-        header_bw = ctk.CTkFrame(card_bw, fg_color="transparent")
-        header_bw.grid(row=0, column=0, sticky="ew", padx=10, pady=(8, 0))
-        header_bw.grid_columnconfigure(0, weight=1)
+        header = ctk.CTkFrame(card, fg_color="transparent")
+        header.grid(row=0, column=0, sticky="ew", padx=10, pady=(8, 0))
+        header.grid_columnconfigure(0, weight=1)
 
-        title_bw = ctk.CTkLabel(
-            header_bw,
-            text="Largura de Banda (BW)",
+        ctk.CTkLabel(
+            header,
+            text=title,
             font=("Arial", 12, "bold"),
-        )
-        title_bw.grid(row=0, column=0, sticky="w")
+        ).grid(row=0, column=0, sticky="w")
 
-        info_bw = ctk.CTkLabel(
-            header_bw,
+        info = ctk.CTkLabel(
+            header,
             text="i",
             width=20,
             height=20,
@@ -290,32 +446,31 @@ class TabSimulator:
             fg_color="#444444",
             font=("Arial", 13, "bold"),
         )
-        info_bw.grid(row=0, column=1, padx=(6, 0))
-        ToolTip(info_bw, "Clique aqui para ver detalhes.")
-        info_bw.bind("<Button-1>", lambda e: self._open_info_popup("BW"))
-
-        self.lbl_bw_nom = ctk.CTkLabel(
-            card_bw,
+        info.grid(row=0, column=1, padx=(6, 0))
+        if tooltip_text:
+            ToolTip(info, tooltip_text)
+        if info_key:
+            info.bind("<Button-1>", lambda e: self._open_info_popup(info_key))
+
+        lbl_value = ctk.CTkLabel(
+            card,
             text="---",
-            font=("Arial", 18, "bold"),
+            font=("Arial", value_font_size, "bold"),
             text_color="#4da6ff",
         )
-        self.lbl_bw_nom.grid(row=1, column=0, pady=(6, 8), padx=10, sticky="n")
-
-        # ====== FIGURA ======
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.view_area)
-        self.canvas.draw()
-        self.toolbar = NavigationToolbar2Tk(
-            self.canvas, self.view_area, pack_toolbar=False
-        )
-        self.toolbar.update()
+        lbl_value.grid(row=1, column=0, pady=value_pady, padx=10, sticky="n")
 
-        self.toolbar.pack(side='bottom', fill='x', padx=10, pady=5)
-        self.canvas.get_tk_widget().pack(
-            side="top", fill="both", expand=True, padx=10, pady=(5, 10)
-        )
+        # checkbox na mesma linha (row=2) em todos os cards que o têm
+        if var is not None:
+            ctk.CTkCheckBox(
+                card,
+                text=chk_text,
+                variable=var,
+                command=self._refresh_overlays,
+                font=("Arial", 11),
+            ).grid(row=2, column=0, pady=(0, 8), padx=10, sticky="w")
 
-    # ==================== CONTROLES / SLIDERS ====================
+        return lbl_value
 
     def _build_controls(self):
 
@@ -384,6 +539,12 @@ class TabSimulator:
             )
             slider.pack(side="left", fill="x", expand=True, padx=(0, 5))
             slider.set(0.5)  # meio termo
+            # Ao soltar o slider, simula a posição final
+            slider.bind(
+                "<ButtonRelease-1>",
+                lambda _e, k=key: self._on_range_slider_release(k),
+                add="+",
+            )
 
             lbl_eff = ctk.CTkLabel(
                 slider_row,
@@ -415,7 +576,7 @@ class TabSimulator:
             self.sidebar,
             text="Mostrar banda de tolerância no gráfico",
             variable=self.show_tolerance,
-            command=self.run_simulation,
+            command=self._refresh_overlays,
             font=("Arial", 11),
         )
         self.chk_tolerance_sidebar.pack(fill="x", padx=20, pady=(5, 5))
@@ -563,9 +724,7 @@ class TabSimulator:
         Se falhar, pode mostrar erro (show_errors=True) e retorna None.
         """
         try:
-            text = entry.get().strip().replace(",", ".")
-            value = float(text)
-            return value
+            return _parse_number(entry.get())
         except ValueError:
             if show_errors:
                 msgbox.showerror(
@@ -722,28 +881,40 @@ class TabSimulator:
             pos = 0.5 -> center * 1          (center)
             pos = 1   -> center * fator_max  (center*10)
         """
-        import math
-
         self._ensure_center_initialized(key, show_errors=False)
         if key not in self.center_values_SI or key not in self.sliders:
             return None
 
         center = float(self.center_values_SI[key])
 
-        fmin = 1.0 / float(self.RANGE_FACTOR_BELOW)
-        fmax = float(self.RANGE_FACTOR_ABOVE)
-
         pos = float(self.sliders[key].get())  # 0..1
 
-        # interpolação log10 nos fatores
-        log_fmin = math.log10(fmin)
-        log_fmax = math.log10(fmax)
-        log_f = log_fmin + pos * (log_fmax - log_fmin)
+        # interpolação log10 nos fatores (expoentes pré-calculados no __init__)
+        log_f = self._log_fmin + pos * self._log_span
         factor = 10 ** log_f
 
         val_SI = center * factor
         return val_SI
 
+    def _compute_all_rlc_si(self):
+        """
+        Versão vetorizada de _compute_effective_component_value para R, L e C
+        de uma vez: lê os três sliders e aplica a interpolação log numa única
+        operação NumPy.
+
+        Retorna um array [R, L, C] em SI; componentes sem centro/slider
+        definidos vêm como NaN.
+        """
+        centers = np.full(3, np.nan)
+        pos = np.zeros(3)
+        for i, key in enumerate(("R", "L", "C")):
+            self._ensure_center_initialized(key, show_errors=False)
+            if key in self.center_values_SI and key in self.sliders:
+                centers[i] = self.center_values_SI[key]
+                pos[i] = self.sliders[key].get()
+
+        return centers * np.power(10.0, self._log_fmin + pos * self._log_span)
+
     def _update_effective_label(self, key: str, value_SI: float):
         """
         Atualiza o label 'Atual: ...' convertendo o valor em SI para a
@@ -761,8 +932,14 @@ class TabSimulator:
     def _on_range_slider_change(self, key: str, slider_pos: float):
         """
         Callback do slider: ajusta o valor efetivo em torno do centro,
-        atualiza o label e recalcula a simulação sem popups.
+        atualiza o label na hora e agenda a simulação (sem popups).
         """
+        # O slider dispara vários eventos no mesmo passo: nada muda, ignora
+        step = int(round(slider_pos * 100))
+        if step == self._last_step.get(key):
+            return
+        self._last_step[key] = step
+
         val_SI = self._compute_effective_component_value(key)
         if val_SI is not None:
             self._update_effective_label(key, val_SI)
@@ -770,25 +947,42 @@ class TabSimulator:
             if key in self.effective_labels:
                 self.effective_labels[key].configure(text="Atual: --")
 
-        self.run_simulation(show_errors=False)
+        # Durante o arraste o label acompanha todo evento; o gráfico, 1 em 3
+        self._drag_tick += 1
+        if self._drag_tick % 3 == 0:
+            self._schedule_simulation()
+
+    def _on_range_slider_release(self, key: str):
+        """
+        Fim do arraste: descarta a simulação agendada e simula já a posição
+        final do slider, que é a que deve ficar no gráfico.
+        """
+        self._drag_tick = 0
+        if self._pending_sim_id is not None:
+            self.parent.after_cancel(self._pending_sim_id)
+            self._pending_sim_id = None
+        self._submit_simulation()
+
+    def _schedule_simulation(self, delay_ms: int = 40):
+        """
+        Agenda uma simulação sem popups para daqui a `delay_ms`, cancelando
+        a que ainda estiver pendente: num arraste rápido só a última posição
+        é simulada.
+        """
+        if self._pending_sim_id is not None:
+            self.parent.after_cancel(self._pending_sim_id)
+        self._pending_sim_id = self.parent.after(delay_ms, self._run_scheduled_simulation)
+
+    def _run_scheduled_simulation(self):
+        self._pending_sim_id = None
+        self._submit_simulation()
 
     def _format_freq_eng(self, f_hz: float) -> str:
         """
         Formata frequência em unidades de engenharia fixas,
         independentes do eixo do gráfico.
         """
-        if f_hz is None or f_hz <= 0:
-            return "---"
-
-        f = abs(f_hz)
-        if f >= 1e9:
-            return f"{f_hz / 1e9:.2f} GHz"
-        elif f >= 1e6:
-            return f"{f_hz / 1e6:.2f} MHz"
-        elif f >= 1e3:
-            return f"{f_hz / 1e3:.2f} kHz"
-        else:
-            return f"{f_hz:.2f} Hz"
+        return _format_freq_eng_cached(f_hz)
         
     def _apply_reverse_result(self, L_H: float, C_F: float):
         """
@@ -821,6 +1015,12 @@ class TabSimulator:
         # Roda simulação com novos componentes
         self.run_simulation(show_errors=False)
 
+    def _apply_reverse_result_by_id(self, btn_id: int):
+        """Botão 'Aplicar' de uma linha: busca o par (L, C) atual da linha."""
+        pair = self._row_data.get(btn_id)
+        if pair is not None:
+            self._apply_reverse_result(*pair)
+
     def open_reverse_calculator_popup(self):
         """
         Abre a calculadora de projeto inverso em um único popup:
@@ -829,6 +1029,10 @@ class TabSimulator:
         - resultados aparecem na própria janela;
         - cada linha tem botão 'Aplicar' que injeta L/C no simulador.
         """
+        # (L, C) de cada linha de resultado, por id do botão 'Aplicar'.
+        # Popup é modal (grab_set): só existe uma calculadora aberta por vez.
+        self._row_data = {}
+
         popup = ctk.CTkToplevel(self.parent)
         popup.title("Calculadora de Projeto Inverso (f₀ alvo)")
         popup.geometry("900x600")
@@ -985,7 +1189,54 @@ class TabSimulator:
         results_frame = ctk.CTkScrollableFrame(root_frame, fg_color="transparent")
         results_frame.pack(fill="both", expand=True, pady=(2, 0))
 
+        # Linhas de resultado reaproveitadas entre cliques em CALCULAR:
+        # cada item guarda o frame da linha, seus labels e o botão.
+        row_pool = []
+
+        def get_result_row(i):
+            if i < len(row_pool):
+                return row_pool[i]
+
+            row = ctk.CTkFrame(results_frame, fg_color=("#2b2b2b", "#2b2b2b"), corner_radius=4)
+            row.grid_columnconfigure((0, 1, 2, 3, 4, 5), weight=1)
+
+            cells = {"row": row, "packed": False}
+            for col, (name, sticky) in enumerate(
+                (("lbl_L", "w"), ("lbl_C", "w"), ("lbl_f0", ""), ("lbl_err", ""), ("lbl_q", ""))
+            ):
+                lbl = ctk.CTkLabel(row, text="", font=("Arial", 11))
+                lbl.grid(row=0, column=col, padx=5, sticky=sticky)
+                cells[name] = lbl
+
+            btn = ctk.CTkButton(
+                row,
+                text="Aplicar",
+                width=80,
+                fg_color="#00C853",
+                text_color="black",
+            )
+            btn.configure(command=partial(self._apply_reverse_result_by_id, id(btn)))
+            btn.grid(row=0, column=5, padx=5)
+            cells["btn"] = btn
+
+            row_pool.append(cells)
+            return cells
+
+        def hide_result_rows(start):
+            for cells in row_pool[start:]:
+                if cells["packed"]:
+                    cells["row"].pack_forget()
+                    cells["packed"] = False
+
         # ===== helper interno para habilitar/desabilitar campos/checkboxes =====
+        # último estado aplicado por widget: só chama configure se mudar
+        last_state = {}
+
+        def set_state(widget, state):
+            if last_state.get(id(widget)) != state:
+                widget.configure(state=state)
+                last_state[id(widget)] = state
+
         def update_fixed_states():
             checked = [var_R.get(), var_L.get(), var_C.get()]
             count = sum(1 for v in checked if v)
@@ -996,12 +1247,9 @@ class TabSimulator:
                 (var_L, ent_L, cmb_L_unit),
                 (var_C, ent_C, cmb_C_unit),
             ]:
-                if var.get():
-                    entry.configure(state="normal")
-                    menu.configure(state="normal")
-                else:
-                    entry.configure(state="disabled")
-                    menu.configure(state="disabled")
+                state = "normal" if var.get() else "disabled"
+                set_state(entry, state)
+                set_state(menu, state)
 
             # no máximo 2 componentes fixos: se já tem 2, desabilita o terceiro checkbox
             for var, chk in [
@@ -1010,59 +1258,91 @@ class TabSimulator:
                 (var_C, chk_C),
             ]:
                 if not var.get() and count >= 2:
-                    chk.configure(state="disabled")
+                    set_state(chk, "disabled")
                 else:
-                    chk.configure(state="normal")
+                    set_state(chk, "normal")
+
+        # cliques seguidos nos checkboxes viram uma única sincronização (after_idle)
+        fixed_sync_pending = False
+
+        def schedule_fixed_states():
+            nonlocal fixed_sync_pending
+            if not fixed_sync_pending:
+                fixed_sync_pending = True
+                popup.after_idle(run_fixed_states)
+
+        def run_fixed_states():
+            nonlocal fixed_sync_pending
+            fixed_sync_pending = False
+            update_fixed_states()
 
         # conectar mudança de estado
-        chk_R.configure(command=update_fixed_states)
-        chk_L.configure(command=update_fixed_states)
-        chk_C.configure(command=update_fixed_states)
+        chk_R.configure(command=schedule_fixed_states)
+        chk_L.configure(command=schedule_fixed_states)
+        chk_C.configure(command=schedule_fixed_states)
         update_fixed_states()  # inicial
 
         # ===== callback do botão CALCULAR =====
-        def on_calculate():
-            # --- lê f0 alvo ---
+        def parse_positive(entry, unit_menu, msg_not_number, msg_not_positive):
+            """
+            Lê `entry` na unidade de `unit_menu` e converte para SI, validando
+            já aqui. Retorna (valor_SI, None) ou (None, mensagem de erro).
+            """
             try:
-                target_val = float(ent_f0.get().replace(",", "."))
+                value = _parse_number(entry.get()) * get_multiplier(unit_menu.get())
             except ValueError:
-                msgbox.showerror("Valor inválido", "f₀ alvo deve ser numérico.")
-                return
+                return None, msg_not_number
+            if value <= 0:
+                return None, msg_not_positive
+            return value, None
 
-            unit = cmb_f0_unit.get()
-            target_f0_hz = target_val * get_multiplier(unit)
-            if target_f0_hz <= 0:
-                msgbox.showerror("Valor inválido", "f₀ alvo deve ser maior que zero.")
+        def on_calculate():
+            # --- lê f0 alvo ---
+            target_f0_hz, err = parse_positive(
+                ent_f0, cmb_f0_unit,
+                "f₀ alvo deve ser numérico.",
+                "f₀ alvo deve ser maior que zero.",
+            )
+            if err:
+                msgbox.showerror("Valor inválido", err)
                 return
 
-            # --- componentes fixos opcionais ---
+            # --- componentes fixos opcionais (cada um validado ao ser lido) ---
             R_fixed = None
             L_candidates = None
             C_candidates = None
 
             if var_R.get():
-                try:
-                    vR = float(ent_R.get().replace(",", "."))
-                except ValueError:
-                    msgbox.showerror("Valor inválido", "R fixo deve ser numérico.")
+                R_fixed, err = parse_positive(
+                    ent_R, cmb_R_unit,
+                    "R fixo deve ser numérico.",
+                    "R deve ser maior que zero para cálculo de Q.",
+                )
+                if err:
+                    msgbox.showerror("Valor inválido", err)
                     return
-                R_fixed = vR * get_multiplier(cmb_R_unit.get())
 
             if var_L.get():
-                try:
-                    vL = float(ent_L.get().replace(",", "."))
-                except ValueError:
-                    msgbox.showerror("Valor inválido", "L fixa deve ser numérica.")
+                L_fixed, err = parse_positive(
+                    ent_L, cmb_L_unit,
+                    "L fixa deve ser numérica.",
+                    "L fixa deve ser maior que zero.",
+                )
+                if err:
+                    msgbox.showerror("Valor inválido", err)
                     return
-                L_candidates = [vL * get_multiplier(cmb_L_unit.get())]
+                L_candidates = (L_fixed,)
 
             if var_C.get():
-                try:
-                    vC = float(ent_C.get().replace(",", "."))
-                except ValueError:
-                    msgbox.showerror("Valor inválido", "C fixa deve ser numérica.")
+                C_fixed, err = parse_positive(
+                    ent_C, cmb_C_unit,
+                    "C fixa deve ser numérica.",
+                    "C fixa deve ser maior que zero.",
+                )
+                if err:
+                    msgbox.showerror("Valor inválido", err)
                     return
-                C_candidates = [vC * get_multiplier(cmb_C_unit.get())]
+                C_candidates = (C_fixed,)
 
             # se R ainda não definido, usa o R efetivo do simulador
             if R_fixed is None:
@@ -1071,33 +1351,32 @@ class TabSimulator:
                     R_fixed = R_eff
                 else:
                     try:
-                        base_R = float(self.ent_r.get().replace(",", "."))
+                        base_R = _parse_number(self.ent_r.get())
                     except ValueError:
                         msgbox.showerror("Valor inválido", "Valor de R no simulador é inválido.")
                         return
                     R_fixed = base_R * get_multiplier(self.units_refs["R"].get())
 
-            if R_fixed <= 0:
-                msgbox.showerror("Valor inválido", "R deve ser maior que zero para cálculo de Q.")
-                return
+                if R_fixed <= 0:
+                    msgbox.showerror("Valor inválido", "R deve ser maior que zero para cálculo de Q.")
+                    return
 
-            # --- chama core ---
+            # --- chama core (memoizado) ---
             try:
-                results = design_rlc_for_target_f0(
-                    target_f0_hz=target_f0_hz,
-                    R_fixed=R_fixed,
-                    L_candidates_h=L_candidates,
-                    C_candidates_f=C_candidates,
-                    max_results=50,
-                    max_error_pct=50.0,
+                results = _design_cached(
+                    target_f0_hz,
+                    R_fixed,
+                    L_candidates,
+                    C_candidates,
+                    50,
+                    50.0,
                 )
             except Exception as e:
                 msgbox.showerror("Erro no cálculo", f"Ocorreu um erro no projeto inverso:\n{e}")
                 return
 
-            # limpa lista
-            for w in results_frame.winfo_children():
-                w.destroy()
+            # esconde linhas que sobrarem do cálculo anterior
+            hide_result_rows(len(results))
 
             if not results:
                 msgbox.showinfo(
@@ -1108,39 +1387,32 @@ class TabSimulator:
 
             # unidades de exibição = as mesmas do simulador
             L_unit = self.units_refs["L"].get()
-            L_factor = get_multiplier(L_unit)
+            L_inv = 1.0 / UNIT_MULTIPLIERS[L_unit]
             C_unit = self.units_refs["C"].get()
-            C_factor = get_multiplier(C_unit)
-
-            for res in results:
-                row = ctk.CTkFrame(results_frame, fg_color=("#2b2b2b", "#2b2b2b"), corner_radius=4)
-                row.pack(fill="x", padx=2, pady=2)
-                row.grid_columnconfigure((0, 1, 2, 3, 4, 5), weight=1)
-
-                L_H = res["L_H"]
-                C_F = res["C_F"]
-                f0_calc = res["f0_calc_Hz"]
-                err = res["error_pct"]
-                Q = res["Q"]
-
-                L_disp = L_H / L_factor
-                C_disp = C_F / C_factor
-
-                ctk.CTkLabel(row, text=f"{L_disp:.4g} {L_unit}", font=("Arial", 11)).grid(row=0, column=0, padx=5, sticky="w")
-                ctk.CTkLabel(row, text=f"{C_disp:.4g} {C_unit}", font=("Arial", 11)).grid(row=0, column=1, padx=5, sticky="w")
-                ctk.CTkLabel(row, text=self._format_freq_eng(f0_calc), font=("Arial", 11)).grid(row=0, column=2, padx=5)
-                ctk.CTkLabel(row, text=f"{err:.2f} %", font=("Arial", 11)).grid(row=0, column=3, padx=5)
-                ctk.CTkLabel(row, text=f"{Q:.2f}" if Q is not None else "-", font=("Arial", 11)).grid(row=0, column=4, padx=5)
-
-                btn_apply = ctk.CTkButton(
-                    row,
-                    text="Aplicar",
-                    width=80,
-                    fg_color="#00C853",
-                    text_color="black",
-                    command=lambda L=L_H, C=C_F: self._apply_reverse_result(L, C),
+            C_inv = 1.0 / UNIT_MULTIPLIERS[C_unit]
+
+            # formata todos os textos antes de tocar nos widgets
+            row_texts = [
+                (
+                    f"{res['L_H'] * L_inv:.4g} {L_unit}",
+                    f"{res['C_F'] * C_inv:.4g} {C_unit}",
+                    self._format_freq_eng(res["f0_calc_Hz"]),
+                    f"{res['error_pct']:.2f} %",
+                    f"{res['Q']:.2f}" if res["Q"] is not None else "-",
                 )
-                btn_apply.grid(row=0, column=5, padx=5)
+                for res in results
+            ]
+
+            for i, (res, texts) in enumerate(zip(results, row_texts)):
+                cells = get_result_row(i)
+
+                for name, text in zip(("lbl_L", "lbl_C", "lbl_f0", "lbl_err", "lbl_q"), texts):
+                    cells[name].configure(text=text)
+                self._row_data[id(cells["btn"])] = (res["L_H"], res["C_F"])
+
+                if not cells["packed"]:
+                    cells["row"].pack(fill="x", padx=2, pady=2)
+                    cells["packed"] = True
 
         btn_calc.configure(command=on_calculate)
 
@@ -1207,56 +1479,9 @@ class TabSimulator:
         Abre um popup com explicação teórica detalhada
         para a métrica selecionada: 'f0', 'Q' ou 'BW'.
         """
-        if metric == "f0":
-            title = "Frequência de Ressonância (f₀)"
-            text = (
-                "A frequência de ressonância f₀ é o ponto em que o circuito RLC série\n"
-                "apresenta máxima transferência de energia para o resistor.\n\n"
-                "No circuito RLC série ideal (R em série com L e C), f₀ depende apenas\n"
-                "de L e C, dada por:\n\n"
-                "    f₀ = 1 / (2·π·√(L·C))\n\n"
-                "Em termos físicos:\n"
-                "  • A reatância indutiva:   X_L = 2·π·f·L   (cresce com a frequência)\n"
-                "  • A reatância capacitiva: X_C = 1 / (2·π·f·C)   (decresce com a frequência)\n\n"
-                "Em f₀ temos X_L = X_C, as reatâncias se cancelam e o circuito é puramente\n"
-                "resistivo.\n\n"
-                "Neste ponto, a corrente é máxima e a tensão medida no resistor atinge o\n"
-                "valor máximo para uma dada tensão de entrada."
-            )
-        elif metric == "Q":
-            title = "Fator de Qualidade (Q)"
-            text = (
-                "O fator de qualidade Q mede quão seletivo é o circuito em torno da\n"
-                "frequência de ressonância f₀.\n\n"
-                "Para o RLC série, vale:\n\n"
-                "    Q = (1 / R) · √(L / C)\n\n"
-                "Interpretação:\n"
-                "  • Q alto  → pico de ressonância estreito e mais alto (mais seletivo).\n"
-                "  • Q baixo → resposta mais larga e menos pronunciada.\n\n"
-                "Q se relaciona com a largura de banda BW por:\n\n"
-                "    Q = f₀ / BW\n\n"
-                "onde BW = f₂ − f₁ e f₁, f₂ são as frequências de meia-potência\n"
-                "(pontos em que a potência cai para metade do valor máximo,\n"
-                "ou seja, |V| ≈ 0,707·|Vₘₐₓ|)."
-            )
-        elif metric == "BW":
-            title = "Largura de Banda (BW)"
-            text = (
-                "A largura de banda BW indica a faixa de frequências em torno de f₀\n"
-                "onde o circuito ainda apresenta ganho significativo.\n\n"
-                "Definição de meia-potência:\n\n"
-                "    BW = f₂ − f₁\n\n"
-                "onde f₁ e f₂ são as frequências em que a potência cai para metade do\n"
-                "valor máximo.\n\n"
-                "No RLC série, vale ainda a relação:\n\n"
-                "    BW = f₀ / Q\n\n"
-                "Assim:\n"
-                "  • Q alto  → BW estreita (circuito bem seletivo).\n"
-                "  • Q baixo → BW larga (resposta mais espalhada em frequência)."
-            )
-        else:
-            title = "Informação"
-            text = "Métrica não reconhecida."
+        title, text = _INFO_POPUP_CONTENT.get(
+            metric, ("Informação", "Métrica não reconhecida.")
+        )
 
         popup = ctk.CTkToplevel(self.parent)
         popup.title(title)
@@ -1300,229 +1525,368 @@ class TabSimulator:
     # ==================== SIMULAÇÃO ====================
 
     def run_simulation(self, show_errors: bool = True):
+        # Resultado de simulação em segundo plano que ainda chegar fica obsoleto
+        self._inflight = None
         try:
-            # Se veio do botão SIMULAR (show_errors=True), tratar como se todos os "OK"
-            # tivessem sido pressionados, se os inputs mudaram.
-            if show_errors:
-                for key, entry in (("R", self.ent_r), ("L", self.ent_l), ("C", self.ent_c)):
-                    txt = entry.get().strip()
-                    last = self.last_center_entry_text.get(key, None)
-                    if last is None or txt != last:
-                        # Recentraliza com base no input atual
-                        self._recenter_range_from_entry(key, show_errors=True)
-
-            # ---------- Leitura de valores NOMINAIS (fallback) ----------
-            R_base = self._parse_float_entry(self.ent_r, "Resistor (R)", show_errors)
-            L_base = self._parse_float_entry(self.ent_l, "Indutor (L)", show_errors)
-            C_base = self._parse_float_entry(self.ent_c, "Capacitor (C)", show_errors)
-
-            if R_base is None or L_base is None or C_base is None:
+            args = self._read_sim_inputs(show_errors)
+            if args is None:
                 return
 
-            R_base *= get_multiplier(self.units_refs["R"].get())
-            L_base *= get_multiplier(self.units_refs["L"].get())
-            C_base *= get_multiplier(self.units_refs["C"].get())
-
-            # Valores efetivos via center + slider (se válidos)
-            R_eff = self._compute_effective_component_value("R")
-            L_eff = self._compute_effective_component_value("L")
-            C_eff = self._compute_effective_component_value("C")
-
-            R_nom = R_eff if R_eff is not None else R_base
-            L_nom = L_eff if L_eff is not None else L_base
-            C_nom = C_eff if C_eff is not None else C_base
-
-            # Atualiza labels "Atual: ..." mesmo se a simulação veio do botão
-            if R_eff is not None:
-                self._update_effective_label("R", R_nom)
-            if L_eff is not None:
-                self._update_effective_label("L", L_nom)
-            if C_eff is not None:
-                self._update_effective_label("C", C_nom)
-
-            # ---------- Tolerâncias ----------
-            tol_R = self._parse_float_entry(self.ent_r_tol, "Tolerância de R (%)", show_errors)
-            tol_L = self._parse_float_entry(self.ent_l_tol, "Tolerância de L (%)", show_errors)
-            tol_C = self._parse_float_entry(self.ent_c_tol, "Tolerância de C (%)", show_errors)
-
-            if tol_R is None or tol_L is None or tol_C is None:
+            # Entradas iguais às da última simulação aplicada: curvas e cards
+            # já estão certos, mas as flags de visualização podem ter mudado
+            # (ex.: REDEFINIR PARA PADRÃO religa a banda), então só elas são
+            # reaplicadas. O botão SIMULAR (show_errors) sempre reaplica tudo,
+            # o que também desfaz zoom/pan da toolbar.
+            key = tuple(map(_quantize, args))
+            if not show_errors and key == self._last_sim_key:
+                self._refresh_overlays()
                 return
 
-            tol_R /= 100.0
-            tol_L /= 100.0
-            tol_C /= 100.0
+            self._apply_sim_result(_simulate_cached(*key), args[6], reset_axes=show_errors)
+            self._last_sim_key = key
 
-            # ---------- V_in ----------
-            V_in_plot = self._parse_float_entry(self.ent_vin, "Amplitude de Entrada (Vpp)", show_errors)
-            if V_in_plot is None:
-                return
+        except ZeroDivisionError:
+            if show_errors:
+                msgbox.showerror(
+                    "Erro",
+                    "Divisão por Zero. Verifique se R, L ou C não são zero.",
+                )
+        except Exception as e:
+            if show_errors:
+                msgbox.showerror("Erro de Simulação", f"Ocorreu um erro: {e}")
 
-            # ---------- Faixa de frequência para simulação ----------
-            freq_min_Hz = None
-            freq_max_Hz = None
+    def _submit_simulation(self):
+        """
+        Versão em segundo plano de run_simulation (sem popups), usada pelos
+        sliders: lê as entradas aqui, roda o cálculo numérico no executor e
+        aplica o resultado de volta na thread da GUI via after(0, ...).
 
-            if not self.freq_auto.get():
-                fmin = self._parse_float_entry(
-                    self.freq_min_entry,
-                    "f_min (frequência mínima)",
-                    show_errors,
-                )
-                fmax = self._parse_float_entry(
-                    self.freq_max_entry,
-                    "f_max (frequência máxima)",
-                    show_errors,
-                )
+        Uma nova submissão torna obsoleta a anterior: se ela ainda não
+        começou é cancelada; se já terminou, o resultado é descartado.
+        """
+        try:
+            args = self._read_sim_inputs(show_errors=False)
+        except Exception:
+            return
+        if args is None:
+            return
 
-                if fmin is not None and fmax is not None:
-                    umin = self.freq_min_unit.get()
-                    umax = self.freq_max_unit.get()
-                    freq_min_Hz = fmin * get_multiplier(umin)
-                    freq_max_Hz = fmax * get_multiplier(umax)
-
-                    if (
-                        freq_min_Hz <= 0
-                        or freq_max_Hz <= 0
-                        or freq_min_Hz >= freq_max_Hz
-                    ):
-                        if show_errors:
-                            msgbox.showerror(
-                                "Faixa de frequência inválida",
-                                "Verifique se f_min e f_max são positivos e f_min < f_max."
-                            )
-                        # se inválido, volta para automático
-                        freq_min_Hz = None
-                        freq_max_Hz = None
-
-            # ---------- Chamada ao core ----------
-            (
-                freqs,
-                nom_curve_Vout,
-                min_curve_Vout,
-                max_curve_Vout,
-                metrics_nom,
-                ranges,
-                Vout_max_global,
-            ) = simulate_response_with_tolerances(
-                R_nom=R_nom,
-                L_nom=L_nom,
-                C_nom=C_nom,
-                tol_R=tol_R,
-                tol_L=tol_L,
-                tol_C=tol_C,
-                V_in_plot=V_in_plot,
-                freq_min=freq_min_Hz,
-                freq_max=freq_max_Hz,
-            )
+        if self._inflight is not None:
+            self._inflight.cancel()
+            self._inflight = None
 
-            # Guarda a curva nominal e Vin para salvar como teórico depois
-            self.last_freqs = np.array(freqs, dtype=float)
-            self.last_nom_curve_Vout = np.array(nom_curve_Vout, dtype=float)
-            self.last_V_in_plot = float(V_in_plot)
-
-            f0 = metrics_nom["f0"]
-            Q = metrics_nom["Q"]
-            BW_nom = metrics_nom["BW"]
-            f1_nom = metrics_nom["f1"]
-            f2_nom = metrics_nom["f2"]
-
-            self.f1_nom = f1_nom
-            self.f2_nom = f2_nom
-
-            # Guarda métricas cruas e faixa real usada (do vetor freqs)
-            self.last_metrics_nom = dict(metrics_nom)  # cópia simples
-            if freqs is not None and len(freqs) > 0:
-                self.last_freq_min_Hz_used = float(freqs[0])
-                self.last_freq_max_Hz_used = float(freqs[-1])
-            else:
-                self.last_freq_min_Hz_used = None
-                self.last_freq_max_Hz_used = None
+        # Voltou às entradas já aplicadas (ex.: slider de volta à posição):
+        # basta descartar o que estava em andamento
+        key = tuple(map(_quantize, args))
+        if key == self._last_sim_key:
+            return
 
-            # ---------- Gráfico ----------
-            self.ax.clear()
-            freq_factor, freq_unit = setup_frequency_axis(self.ax, freqs)
+        future = self._executor.submit(_simulate_cached, *key)
+        self._inflight = future
+        future.add_done_callback(
+            lambda f: self.parent.after(0, self._on_simulation_done, f, key, args[6])
+        )
 
-            f0_str = format_frequency_for_unit(f0, freq_factor, freq_unit)
-            self.ax.set_title(f"Simulação RLC (f0={f0_str}, Q={Q:.2f})")
-            self.ax.set_ylabel(f"Tensão de Saída (Vpp) | V_in = {V_in_plot:.1f} V")
-            self.ax.grid(True, which="both", alpha=0.3)
+    def _on_simulation_done(self, future, key, V_in_plot):
+        """Recebe (na thread da GUI) o resultado de _submit_simulation."""
+        if future is not self._inflight or future.cancelled():
+            return
+        self._inflight = None
+        try:
+            self._apply_sim_result(future.result(), V_in_plot)
+            self._last_sim_key = key
+        except Exception:
+            # Simulações dos sliders não mostram popups de erro
+            pass
 
-            if Vout_max_global > 0:
-                self.ax.set_ylim(0, Vout_max_global * 1.1)
-            else:
-                self.ax.set_ylim(0, 1.1)
-
-            # ---------- Cards ----------
-            self.lbl_f0_nom.configure(text=self._format_freq_eng(f0))
-            self.lbl_q_nom.configure(text=f"{Q:.2f}")
-            self.lbl_bw_nom.configure(text=self._format_freq_eng(BW_nom))
-
-            if hasattr(self, "lbl_f1f2"):
-                f1_txt = format_frequency_for_unit(f1_nom, freq_factor, freq_unit)
-                f2_txt = format_frequency_for_unit(f2_nom, freq_factor, freq_unit)
-                self.lbl_f1f2.configure(text=f"f₁ = {f1_txt} | f₂ = {f2_txt}")
-
-            # ---------- Tolerância ----------
-            if self.show_tolerance.get():
-                self.ax.fill_between(
-                    freqs,
-                    min_curve_Vout,
-                    max_curve_Vout,
-                    color='aliceblue',
-                    alpha=0.1,
-                    label='Incerteza Tolerância',
-                )
-                self.ax.plot(
-                    freqs,
-                    max_curve_Vout,
-                    color='lime',
-                    linestyle='--',
-                    linewidth=1,
-                    alpha=0.6,
-                )
-                self.ax.plot(
-                    freqs,
-                    min_curve_Vout,
-                    color='orangered',
-                    linestyle='--',
-                    linewidth=1,
-                    alpha=0.6,
-                )
+    def _read_sim_inputs(self, show_errors: bool):
+        """
+        Lê e valida as entradas da simulação (componentes efetivos,
+        tolerâncias, V_in e faixa de frequência).
+
+        Retorna a tupla de argumentos de simulate_response_with_tolerances,
+        na ordem de _simulate_cached (ainda sem quantizar), ou None se
+        alguma entrada for inválida.
+        """
+        # Se veio do botão SIMULAR (show_errors=True), tratar como se todos os "OK"
+        # tivessem sido pressionados, se os inputs mudaram.
+        if show_errors:
+            for key, entry in (("R", self.ent_r), ("L", self.ent_l), ("C", self.ent_c)):
+                txt = entry.get().strip()
+                last = self.last_center_entry_text.get(key, None)
+                if last is None or txt != last:
+                    # Recentraliza com base no input atual
+                    self._recenter_range_from_entry(key, show_errors=True)
+
+        # ---------- Leitura de valores NOMINAIS (fallback) ----------
+        R_base = self._parse_float_entry(self.ent_r, "Resistor (R)", show_errors)
+        L_base = self._parse_float_entry(self.ent_l, "Indutor (L)", show_errors)
+        C_base = self._parse_float_entry(self.ent_c, "Capacitor (C)", show_errors)
+
+        if R_base is None or L_base is None or C_base is None:
+            return None
+
+        R_base *= get_multiplier(self.units_refs["R"].get())
+        L_base *= get_multiplier(self.units_refs["L"].get())
+        C_base *= get_multiplier(self.units_refs["C"].get())
+
+        # Valores efetivos via center + slider (se válidos)
+        R_eff, L_eff, C_eff = (
+            None if np.isnan(v) else float(v) for v in self._compute_all_rlc_si()
+        )
+
+        R_nom = R_eff if R_eff is not None else R_base
+        L_nom = L_eff if L_eff is not None else L_base
+        C_nom = C_eff if C_eff is not None else C_base
 
-            # ---------- Curva nominal ----------
-            self.ax.plot(
-                freqs,
-                nom_curve_Vout,
-                color='gold',
-                linewidth=2.5,
-                label='Nominal',
+        # Atualiza labels "Atual: ..." mesmo se a simulação veio do botão
+        if R_eff is not None:
+            self._update_effective_label("R", R_nom)
+        if L_eff is not None:
+            self._update_effective_label("L", L_nom)
+        if C_eff is not None:
+            self._update_effective_label("C", C_nom)
+
+        # ---------- Tolerâncias ----------
+        tol_R = self._parse_float_entry(self.ent_r_tol, "Tolerância de R (%)", show_errors)
+        tol_L = self._parse_float_entry(self.ent_l_tol, "Tolerância de L (%)", show_errors)
+        tol_C = self._parse_float_entry(self.ent_c_tol, "Tolerância de C (%)", show_errors)
+
+        if tol_R is None or tol_L is None or tol_C is None:
+            return None
+
+        tol_R /= 100.0
+        tol_L /= 100.0
+        tol_C /= 100.0
+
+        # ---------- V_in ----------
+        V_in_plot = self._parse_float_entry(self.ent_vin, "Amplitude de Entrada (Vpp)", show_errors)
+        if V_in_plot is None:
+            return None
+
+        # ---------- Faixa de frequência para simulação ----------
+        freq_min_Hz = None
+        freq_max_Hz = None
+
+        if not self.freq_auto.get():
+            fmin = self._parse_float_entry(
+                self.freq_min_entry,
+                "f_min (frequência mínima)",
+                show_errors,
+            )
+            fmax = self._parse_float_entry(
+                self.freq_max_entry,
+                "f_max (frequência máxima)",
+                show_errors,
             )
 
-            # ---------- f0 / f1 / f2 ----------
-            if self.show_f0.get():
-                self.ax.axvline(x=f0, color='red', alpha=0.8, label='f0')
+            if fmin is not None and fmax is not None:
+                umin = self.freq_min_unit.get()
+                umax = self.freq_max_unit.get()
+                freq_min_Hz = fmin * get_multiplier(umin)
+                freq_max_Hz = fmax * get_multiplier(umax)
+
+                if (
+                    freq_min_Hz <= 0
+                    or freq_max_Hz <= 0
+                    or freq_min_Hz >= freq_max_Hz
+                ):
+                    if show_errors:
+                        msgbox.showerror(
+                            "Faixa de frequência inválida",
+                            "Verifique se f_min e f_max são positivos e f_min < f_max."
+                        )
+                    # se inválido, volta para automático
+                    freq_min_Hz = None
+                    freq_max_Hz = None
+
+        return (
+            R_nom, L_nom, C_nom,
+            tol_R, tol_L, tol_C,
+            V_in_plot, freq_min_Hz, freq_max_Hz,
+        )
 
-            if self.show_f1f2.get():
-                self.ax.axvline(x=f1_nom, color='aqua', alpha=0.7, label='f1')
-                self.ax.axvline(x=f2_nom, color='aqua', alpha=0.7, label='f2')
+    def _apply_sim_result(self, result, V_in_plot, reset_axes: bool = False):
+        """
+        Aplica o resultado de simulate_response_with_tolerances na GUI:
+        guarda a última curva, atualiza eixos, cards e artistas do gráfico.
 
-            self.ax.legend(loc='upper right', fontsize='small')
-            self.canvas.draw()
+        O eixo de frequência só é reconfigurado quando a faixa simulada
+        muda ou com reset_axes=True (botão SIMULAR, que desfaz zoom/pan).
+        """
+        (
+            freqs,
+            nom_curve_Vout,
+            min_curve_Vout,
+            max_curve_Vout,
+            metrics_nom,
+            ranges,
+            Vout_max_global,
+        ) = result
+
+        # Guarda a curva nominal e Vin para salvar como teórico depois
+        # (float64 contíguo garantido aqui; os vetores do cache já são, sem cópia)
+        self.last_freqs = np.ascontiguousarray(freqs, dtype=np.float64)
+        self.last_nom_curve_Vout = np.ascontiguousarray(nom_curve_Vout, dtype=np.float64)
+        self.last_V_in_plot = float(V_in_plot)
+
+        f0 = metrics_nom["f0"]
+        Q = metrics_nom["Q"]
+        BW_nom = metrics_nom["BW"]
+        f1_nom = metrics_nom["f1"]
+        f2_nom = metrics_nom["f2"]
+
+        self.f1_nom = f1_nom
+        self.f2_nom = f2_nom
+
+        # Guarda métricas cruas e faixa real usada (do vetor freqs)
+        self.last_metrics_nom = dict(metrics_nom)  # cópia simples
+        if freqs is not None and len(freqs) > 0:
+            self.last_freq_min_Hz_used = float(freqs[0])
+            self.last_freq_max_Hz_used = float(freqs[-1])
+        else:
+            self.last_freq_min_Hz_used = None
+            self.last_freq_max_Hz_used = None
+
+        # ---------- Gráfico ----------
+        freq_span = (self.last_freq_min_Hz_used, self.last_freq_max_Hz_used)
+        if reset_axes or freq_span != self._freq_span:
+            self._freq_axis = setup_frequency_axis(self.ax, freqs)
+            self._freq_span = freq_span
+        freq_factor, freq_unit = self._freq_axis
+
+        f0_str = format_frequency_for_unit(f0, freq_factor, freq_unit)
+        self.ax.set_title(f"Simulação RLC (f0={f0_str}, Q={Q:.2f})")
+        self.ax.set_ylabel(f"Tensão de Saída (Vpp) | V_in = {V_in_plot:.1f} V")
+
+        # Com reset_axes o eixo Y volta sempre a (0, topo), desfazendo zoom;
+        # nos sliders só mexe se o topo mudar de fato (evita redesenho
+        # completo por variações mínimas do pico entre uma simulação e outra)
+        y_top = Vout_max_global * 1.1 if Vout_max_global > 0 else 1.1
+        if reset_axes or not np.isclose(self.ax.get_ylim()[1], y_top, rtol=1e-2):
+            self.ax.set_ylim(0, y_top)
+
+        # ---------- Cards ----------
+        self.lbl_f0_nom.configure(text=self._format_freq_eng(f0))
+        self.lbl_q_nom.configure(text=f"{Q:.2f}")
+        self.lbl_bw_nom.configure(text=self._format_freq_eng(BW_nom))
+
+        if hasattr(self, "lbl_f1f2"):
+            f1_txt = format_frequency_for_unit(f1_nom, freq_factor, freq_unit)
+            f2_txt = format_frequency_for_unit(f2_nom, freq_factor, freq_unit)
+            self.lbl_f1f2.configure(text=f"f₁ = {f1_txt} | f₂ = {f2_txt}")
+
+        # ---------- Tolerância ----------
+        # Contorno da banda: envelope mínimo em f crescente, máximo de volta
+        n = len(freqs)
+        verts = np.empty((2 * n, 2))
+        verts[:n, 0] = freqs
+        verts[:n, 1] = min_curve_Vout
+        verts[n:, 0] = freqs[::-1]
+        verts[n:, 1] = max_curve_Vout[::-1]
+        self._tol_band.set_verts([verts])
+
+        self._line_max.set_data(freqs, max_curve_Vout)
+        self._line_min.set_data(freqs, min_curve_Vout)
+
+        # ---------- Curva nominal ----------
+        self._line_nom.set_data(freqs, nom_curve_Vout)
+
+        # ---------- f0 / f1 / f2 ----------
+        self._vline_f0.set_xdata([f0, f0])
+        self._vline_f1.set_xdata([f1_nom, f1_nom])
+        self._vline_f2.set_xdata([f2_nom, f2_nom])
+
+        self._refresh_overlays()
+
+        self.btn_save_theory.configure(state="normal")
+
+    # ==================== BLIT ====================
+
+    def _animated_artists(self):
+        """Artistas redesenhados por blit, na ordem de desenho."""
+        return (
+            self._tol_band,
+            self._line_max,
+            self._line_min,
+            self._line_nom,
+            self._vline_f0,
+            self._vline_f1,
+            self._vline_f2,
+            self.ax.title,
+        )
 
-            self.btn_save_theory.configure(state="normal")
+    def _draw_animated(self):
+        for artist in self._animated_artists():
+            self.ax.draw_artist(artist)
 
-        except ZeroDivisionError:
-            if show_errors:
-                msgbox.showerror(
-                    "Erro",
-                    "Divisão por Zero. Verifique se R, L ou C não são zero.",
-                )
-        except Exception as e:
-            if show_errors:
-                msgbox.showerror("Erro de Simulação", f"Ocorreu um erro: {e}")
+    def _on_canvas_draw(self, event):
+        """Após cada desenho completo: guarda o fundo e desenha os artistas animados."""
+        if event.canvas.is_saving():
+            # Exportação (toolbar/savefig, inclusive em outro canvas para
+            # PDF/SVG): o Axes.draw já inclui os artistas animados, e esse
+            # quadro não serve de fundo para o blit
+            return
+
+        self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _refresh_overlays(self):
+        """
+        Aplica as flags de visualização (banda de tolerância, f0, f1/f2)
+        aos artistas já existentes e redesenha, sem re-simular.
+        """
+        show_tol = self.show_tolerance.get()
+        for artist in (self._tol_band, self._line_max, self._line_min):
+            artist.set_visible(show_tol)
+
+        self._vline_f0.set_visible(self.show_f0.get())
+        self._vline_f1.set_visible(self.show_f1f2.get())
+        self._vline_f2.set_visible(self.show_f1f2.get())
+
+        self._redraw_plot()
+
+    def _redraw_plot(self):
+        """
+        Atualiza o gráfico após uma simulação.
+
+        Se limites, rótulos ou legenda mudaram, agenda o desenho completo
+        com draw_idle (que recaptura o fundo em _on_canvas_draw); senão, só
+        restaura o fundo e redesenha os artistas animados (blit).
+        """
+        handles = [
+            a for a in (self._tol_band, self._line_nom, self._vline_f0, self._vline_f1, self._vline_f2)
+            if a.get_visible()
+        ]
+        labels = tuple(a.get_label() for a in handles)
+
+        layout_key = (
+            self.ax.get_xlim(),
+            self.ax.get_ylim(),
+            self.ax.get_xlabel(),
+            self.ax.get_ylabel(),
+            labels,
+        )
+
+        if layout_key != self._layout_key or self._bg is None:
+            self._layout_key = layout_key
+            with rc_context(_DARK_RC):
+                self.ax.legend(handles, labels, loc='upper right', fontsize='small')
+            # Fundo fica inválido até o desenho agendado; até lá, novas
+            # atualizações também caem aqui e são coalescidas pelo draw_idle
+            self._bg = None
+            self.canvas.draw_idle()
+            return
+
+        self.canvas.restore_region(self._bg)
+        self._draw_animated()
+        self.canvas.blit(self.fig.bbox)
 
     # ==================== SALVAR TEÓRICO ====================
 
     def save_theory_gui(self):
+        from tkinter import filedialog
+
         file_path = filedialog.asksaveasfilename(
             initialdir=self.data_manager.save_dir,
             defaultextension=".json",
@@ -1563,29 +1927,37 @@ class TabSimulator:
         }
 
         # ---------- salva também os pontos da curva nominal (ganho normalizado) ----------
+        curve_points = None
         try:
+            # Sem varredura simulada (ou vazia): nada de curva a salvar
             if (
                 self.last_freqs is not None
+                and self.last_freqs.size > 0
                 and self.last_nom_curve_Vout is not None
-                and self.last_V_in_plot is not None
+                and self.last_nom_curve_Vout.size == self.last_freqs.size
             ):
-                freqs = np.asarray(self.last_freqs, dtype=float)
-                vout = np.asarray(self.last_nom_curve_Vout, dtype=float)
-                vin = float(self.last_V_in_plot)
-
-                if vin <= 0:
-                    vin = 1.0
-
-                gain = vout / vin
-                max_gain = float(np.max(gain)) if gain.size > 0 else 0.0
-                if max_gain > 0:
-                    gain_norm = gain / max_gain
-                else:
-                    gain_norm = gain
-
-                params["curve_points"] = {
-                    "freqs_Hz": freqs.tolist(),
-                    "gain_norm": gain_norm.tolist(),
+                freqs = self.last_freqs
+                vout = self.last_nom_curve_Vout
+
+                # (vout/vin)/max(vout/vin) == vout/max(vout): Vin se cancela,
+                # então basta uma redução e uma passada de quantização
+                vout_max = vout.max().item()
+
+                # Ganho normalizado ∈ [0, 1] em ponto fixo uint16 (passo ~1.5e-5,
+                # muito abaixo do legível no gráfico); curva nula fica toda em 0
+                gain_u16 = np.zeros(vout.size, dtype=np.uint16)
+                if vout_max > 0:
+                    q = vout * (65535.0 / vout_max)
+                    q += 0.5
+                    np.clip(q, 0.0, 65535.0, out=q)
+                    gain_u16[:] = q
+
+                # ndarrays direto para o .npz do DataManager (sem .tolist());
+                # float32 basta para a grade de frequências log
+                curve_points = {
+                    "freqs_Hz": freqs.astype(np.float32),
+                    "gain_u16": gain_u16,
+                    "gain_scale": np.float64(1.0 / 65535.0),
                 }
         except Exception as e:
             # Se der algo errado aqui, ainda assim salvamos o resto
@@ -1593,7 +1965,7 @@ class TabSimulator:
 
         # ---------- grava arquivo ----------
         try:
-            self.data_manager.save_theoretical_params(exp_name, params)
+            self.data_manager.save_theoretical_params(exp_name, params, curve_points=curve_points)
             msgbox.showinfo(
                 "Salvo",
                 f"Parâmetros teóricos '{exp_name}' salvos com sucesso!",
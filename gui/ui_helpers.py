@@ -5,39 +5,68 @@ class ToolTip:
     """
     Cria um pop-up informativo ao passar o mouse sobre um widget.
     """
+    # Uma única janela (oculta) compartilhada por todas as tooltips do app
+    _shared_tw = None
+    _shared_label = None
+    _owner = None
+
+    # Estilo do rótulo (amarelo claro estilo post-it)
+    _LABEL_KW = dict(
+        justify='left',
+        background="#ffffe0",
+        relief='solid',
+        borderwidth=1,
+        font=("tahoma", "9", "normal"),
+    )
+
     def __init__(self, widget, text):
         self.widget = widget
         self.text = text
-        self.tooltip_window = None
+        self._after_id = None
         self.widget.bind("<Enter>", self.show_tooltip)
         self.widget.bind("<Leave>", self.hide_tooltip)
 
     def show_tooltip(self, event=None):
-        if self.tooltip_window or not self.text:
+        if ToolTip._owner is self or self._after_id or not self.text:
+            return
+
+        # Só mostra a janela se o mouse ficar parado sobre o widget por ~500 ms
+        self._after_id = self.widget.after(500, self._show_now)
+
+    @classmethod
+    def _get_shared_window(cls, widget):
+        # Criada sob a raiz (não sob o widget) para sobreviver a popups fechados
+        if cls._shared_tw is None or not cls._shared_tw.winfo_exists():
+            cls._shared_tw = tk.Toplevel(widget.nametowidget("."))
+            cls._shared_tw.withdraw()
+            cls._shared_tw.wm_overrideredirect(True) # Remove borda da janela
+
+            cls._shared_label = tk.Label(cls._shared_tw, **cls._LABEL_KW)
+            cls._shared_label.pack(ipadx=1)
+        return cls._shared_tw
+
+    def _show_now(self):
+        self._after_id = None
+        if ToolTip._owner is self:
             return
         
-        # Coordenadas
-        x, y, _, _ = self.widget.bbox("insert")
-        x += self.widget.winfo_rootx() + 25
-        y += self.widget.winfo_rooty() + 25
-
-        # Criação da Janela
-        self.tooltip_window = tk.Toplevel(self.widget)
-        self.tooltip_window.wm_overrideredirect(True) # Remove borda da janela
-        self.tooltip_window.wm_geometry(f"+{x}+{y}")
-
-        label = tk.Label(
-            self.tooltip_window, 
-            text=self.text, 
-            justify='left',
-            background="#ffffe0", # Amarelo claro estilo post-it
-            relief='solid', 
-            borderwidth=1,
-            font=("tahoma", "9", "normal")
-        )
-        label.pack(ipadx=1)
+        # Coordenadas: ao lado do cursor (bbox("insert") só vale para Entry/Text)
+        x = self.widget.winfo_pointerx() + 15
+        y = self.widget.winfo_pointery() + 20
+
+        # Reaproveita a janela compartilhada: só troca texto e posição
+        tw = self._get_shared_window(self.widget)
+        ToolTip._shared_label.configure(text=self.text)
+        tw.wm_geometry(f"+{x}+{y}")
+        tw.deiconify()
+        tw.lift()
+        ToolTip._owner = self
 
     def hide_tooltip(self, event=None):
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
\ No newline at end of file
+        if self._after_id:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        if ToolTip._owner is self:
+            ToolTip._owner = None
+            if ToolTip._shared_tw.winfo_exists():
+                ToolTip._shared_tw.withdraw()
\ No newline at end of file